@@ -31,10 +31,6 @@ def main():
     # Load consolidated CSS styles
     st.markdown(get_app_styles(), unsafe_allow_html=True)
 
-    # Initialize session state for processor caching
-    if "processor" not in st.session_state:
-        st.session_state.processor = None
-
     # Create navigation and get selected page
     page = create_navigation()
 
@@ -56,15 +52,14 @@ def main():
         render_database_page(processor)
 
 
+@st.cache_resource
 def _get_or_create_processor():
-    """Get or create processor instance with caching."""
-    if st.session_state.processor is None:
-        # Use default settings - processor will be configured in process_transactions page
-        st.session_state.processor = CompactTransactionProcessor(
-            openai_api_key=None,  # Will use environment variable
-            verify_domains=True
-        )
-    return st.session_state.processor
+    """Get or create processor instance shared across sessions and reruns."""
+    # Use default settings - processor will be configured in process_transactions page
+    return CompactTransactionProcessor(
+        openai_api_key=None,  # Will use environment variable
+        verify_domains=True
+    )
 
 
 if __name__ == "__main__":
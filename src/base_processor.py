@@ -1,12 +1,30 @@
 # Base processor class with common functionality to eliminate code duplication
+from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional, Tuple
 
+import pandas as pd
+
 from src.models import Transaction, Vendor, get_db_session
 from src.utils import CSVUtils, DatabaseService, DuplicateDetector
 from src.vendor_matcher import VendorMatcher
 from src.confidence_calculator import ConfidenceCalculator
 
 
+@dataclass(slots=True)
+class TransactionResult:
+    """Per-row processing result; slots keep the per-row footprint small."""
+
+    transaction_id: int
+    date: str
+    text: str
+    amount: float
+    category: str
+    category_confidence: float
+    vendor_name: Optional[str]
+    vendor_confidence: float
+    reasoning: str
+
+
 class BaseTransactionProcessor:
     """Base class containing common transaction processing functionality."""
 
@@ -24,10 +42,8 @@ class BaseTransactionProcessor:
         # Use shared CSV reading utility
         df = CSVUtils.read_csv_with_encoding_detection(csv_path)
 
-        # Extract all transactions using shared utility
-        all_transactions = [
-            CSVUtils.create_transaction_data(row) for _, row in df.iterrows()
-        ]
+        # Extract all transactions using the vectorized shared utility
+        all_transactions = CSVUtils.create_transactions_frame(df)
 
         print(f"✓ Extracted {len(all_transactions)} transactions")
         return all_transactions
@@ -48,7 +64,8 @@ class BaseTransactionProcessor:
             return None, 0.0, "none"
 
         vendor_cache = vendor_cache or {}
-        vendor_key = vendor_name.lower()
+        # casefold: canonical caseless key, correct for non-ASCII vendor names
+        vendor_key = vendor_name.casefold()
 
         # Check cache first
         if vendor_key in vendor_cache:
@@ -78,6 +95,8 @@ class BaseTransactionProcessor:
         confidence: float,
         vendor: Optional[Vendor] = None,
         vendor_confidence: float = 0.0,
+        vendor_match_source: Optional[str] = None,
+        batch_id: Optional[str] = None,
     ) -> Transaction:
         """Create a transaction record with the given data."""
         return Transaction(
@@ -86,39 +105,70 @@ class BaseTransactionProcessor:
             category_confidence=confidence,
             vendor_id=vendor.id if vendor else None,
             vendor_confidence=vendor_confidence,
+            vendor_match_source=vendor_match_source,
+            batch_id=batch_id,
             raw_line=transaction_data["raw_line"],
         )
 
-    def save_transactions(self, transactions: List[Transaction]) -> None:
-        """Save multiple transactions to database in a single commit."""
-        for transaction in transactions:
-            self.db_session.add(transaction)
-
-        self.db_session.commit()
-        print(f"💾 Saved {len(transactions)} transactions to database")
-
-    def format_transaction_result(
+    def create_transaction_mapping(
         self,
         transaction_data: Dict,
         category: str,
         confidence: float,
         vendor: Optional[Vendor] = None,
         vendor_confidence: float = 0.0,
-        reasoning: str = "Processed",
     ) -> Dict:
-        """Format transaction data for result display."""
+        """Build a plain column mapping for bulk_insert_mappings.
+
+        Same fields as create_transaction_record but without instantiating a
+        managed ORM object, so bulk inserts skip unit-of-work bookkeeping.
+        """
         return {
-            "transaction_id": 0,  # Will be updated after database save
-            "date": transaction_data["date"].strftime("%Y-%m-%d"),
-            "text": transaction_data["text"],
-            "amount": transaction_data["amount"],
+            **{k: v for k, v in transaction_data.items() if k != "raw_line"},
             "category": category,
             "category_confidence": confidence,
-            "vendor_name": vendor.name if vendor else None,
+            "vendor_id": vendor.id if vendor else None,
             "vendor_confidence": vendor_confidence,
-            "reasoning": reasoning,
+            "raw_line": transaction_data["raw_line"],
         }
 
+    def save_transactions(self, transactions: List[Transaction]) -> None:
+        """Save multiple transactions to database in a single bulk insert."""
+        self.db_session.bulk_save_objects(transactions)
+        self.db_session.commit()
+        print(f"💾 Saved {len(transactions)} transactions to database")
+
+    def format_transaction_result(
+        self,
+        transaction_data: Dict,
+        category: str,
+        confidence: float,
+        vendor: Optional[Vendor] = None,
+        vendor_confidence: float = 0.0,
+        reasoning: str = "Processed",
+        date_str: Optional[str] = None,
+    ) -> TransactionResult:
+        """Format transaction data for result display.
+
+        Callers formatting many rows can pass date_str from a vectorized
+        pd .dt.strftime pass instead of paying a Python strftime per row.
+        """
+        # Positional construction: field order matches TransactionResult.
+        # transaction_id is 0 until updated after database save.
+        return TransactionResult(
+            0,
+            date_str
+            if date_str is not None
+            else transaction_data["date"].strftime("%Y-%m-%d"),
+            transaction_data["text"],
+            transaction_data["amount"],
+            category,
+            confidence,
+            vendor.name if vendor else None,
+            vendor_confidence,
+            reasoning,
+        )
+
     def process_transactions_batch(
         self,
         transactions: List[Dict],
@@ -126,57 +176,69 @@ class BaseTransactionProcessor:
         vendor_cache: Dict = None,
         progress_callback: Optional[Callable] = None,
         batch_id: str = None,
-    ) -> List[Dict]:
+    ) -> List[TransactionResult]:
         """Process a batch of transactions with AI results and vendor handling."""
         results = []
         vendor_cache = vendor_cache or {}
-
-        for i, (transaction_data, batch_result) in enumerate(
-            zip(transactions, batch_results)
-        ):
-            # Create transaction record
-            transaction = self.create_transaction_record(
-                transaction_data, batch_result.category, batch_result.confidence
-            )
-
-            # Set batch ID for tracking latest processing
-            if batch_id:
-                transaction.batch_id = batch_id
-
-            # Handle vendor processing
-            vendor, vendor_confidence, match_source = self.process_vendor_for_transaction(
-                batch_result.vendor_name, batch_result.category, vendor_cache, transaction_data
-            )
-
-            if vendor:
-                transaction.vendor_id = vendor.id
-                transaction.vendor_confidence = (
+        total = min(len(transactions), len(batch_results))
+
+        # Format all dates in one vectorized pass (C path) instead of per row
+        date_strings = pd.to_datetime(
+            [transactions[i]["date"] for i in range(total)]
+        ).strftime("%Y-%m-%d")
+
+        # Iterate in chunks of 5 so progress is reported once per chunk instead
+        # of testing a modulo branch on every row
+        for chunk_start in range(0, total, 5):
+            chunk_end = min(chunk_start + 5, total)
+            for i in range(chunk_start, chunk_end):
+                transaction_data = transactions[i]
+                batch_result = batch_results[i]
+
+                # Resolve the vendor first so the record is built once with
+                # its final fields instead of constructed and then mutated.
+                # The guard is inlined here so non-vendor rows (the common
+                # case) skip the function call entirely.
+                if batch_result.category == "vendor_payment" and batch_result.vendor_name:
+                    vendor, vendor_confidence, match_source = self.process_vendor_for_transaction(
+                        batch_result.vendor_name, batch_result.category, vendor_cache, transaction_data
+                    )
+                else:
+                    vendor, vendor_confidence, match_source = None, 0.0, "none"
+
+                transaction = self.create_transaction_record(
+                    transaction_data,
+                    batch_result.category,
+                    batch_result.confidence,
+                    vendor,
                     vendor_confidence * batch_result.vendor_confidence
+                    if vendor
+                    else 0.0,
+                    match_source,
+                    batch_id,
                 )
-                transaction.vendor_match_source = match_source
-            else:
-                transaction.vendor_match_source = match_source
-
-            # Add to session
-            self.db_session.add(transaction)
-
-            # Format result
-            result = self.format_transaction_result(
-                transaction_data,
-                batch_result.category,
-                batch_result.confidence,
-                vendor,
-                vendor_confidence,
-                "Batch processed",
-            )
-            results.append(result)
-
-            # Update progress if callback provided
-            if progress_callback and i % 5 == 0:
+
+                # Add to session
+                self.db_session.add(transaction)
+
+                # Format result
+                result = self.format_transaction_result(
+                    transaction_data,
+                    batch_result.category,
+                    batch_result.confidence,
+                    vendor,
+                    vendor_confidence,
+                    "Batch processed",
+                    date_str=date_strings[i],
+                )
+                results.append(result)
+
+            # Update progress once per chunk if callback provided
+            if progress_callback:
                 progress_callback(
-                    i + 1,
-                    len(transactions),
-                    f"Processing transaction {i + 1}/{len(transactions)}",
+                    chunk_end,
+                    total,
+                    f"Processing transaction {chunk_end}/{total}",
                 )
 
         return results
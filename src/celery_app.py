@@ -17,18 +17,23 @@ celery_app = Celery(
 celery_app.conf.update(
     # Task settings
     task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    accept_content=['msgpack', 'json'],
+    result_serializer='msgpack',  # Smaller/faster than JSON for result payloads
+    task_compression='gzip',  # Compress task bodies sent over the broker
     timezone='UTC',
     enable_utc=True,
 
     # Result backend settings
     result_expires=3600,  # Results expire after 1 hour
+    result_extended=False,  # Skip storing task args/kwargs alongside results
 
     # Worker settings
-    worker_prefetch_multiplier=1,
+    worker_concurrency=os.cpu_count(),  # One prefork worker per CPU
+    worker_prefetch_multiplier=1,  # Keep 1: CSV jobs are long-running
     task_acks_late=True,
+    task_reject_on_worker_lost=True,  # Re-queue work if a child is killed
     worker_max_tasks_per_child=1000,
+    worker_max_memory_per_child=512000,  # Recycle children above ~512 MB (KB units)
 
     # Task routing (disabled for now - use default queue)
     # task_routes={
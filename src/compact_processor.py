@@ -1,7 +1,10 @@
 # Compact processor with maximum code reduction
 from typing import Callable, Dict, List, Optional, Tuple
 
-from src.base_processor import BaseTransactionProcessor
+import pandas as pd
+
+from src.base_processor import BaseTransactionProcessor, TransactionResult
+from src.models import Transaction, bulk_insert_transactions
 from src.streamlined_categorizer import StreamlinedCategorizer
 
 
@@ -20,7 +23,8 @@ class CompactTransactionProcessor(BaseTransactionProcessor):
             return None, 0.0, "none"
 
         vendor_cache = vendor_cache or {}
-        vendor_key = vendor_name.lower()
+        # casefold: canonical caseless key, correct for non-ASCII vendor names
+        vendor_key = vendor_name.casefold()
 
         if vendor_key in vendor_cache:
             cached_vendor, cached_confidence = vendor_cache[vendor_key]
@@ -59,37 +63,39 @@ class CompactTransactionProcessor(BaseTransactionProcessor):
         excluded_indices: List[int] = None,
         batch_size: int = 20,
         progress_callback: Optional[Callable] = None,
-    ) -> Tuple[List[Dict], List[Dict]]:
+    ) -> Tuple[List[TransactionResult], List[Dict]]:
         """Process CSV with duplicate detection."""
         all_transactions = self.read_csv_file(csv_path)
         duplicates = self.find_duplicate_transactions(all_transactions)
 
-        excluded_indices = excluded_indices or []
+        excluded_indices = set(excluded_indices or [])
         transactions_to_process = []
         duplicate_info = []
 
-        def _transactions_match(trans1: Dict, trans2: Dict) -> bool:
-            """Compare transactions with robust handling of datetime and float precision."""
-            # Compare essential fields that identify a transaction
-            date1 = trans1.get("date")
-            date2 = trans2.get("date")
-            if not date1 or not date2:
-                return False
-            return (
-                abs(trans1.get("amount", 0) - trans2.get("amount", 0)) < 0.01  # Float precision
-                and trans1.get("text", "") == trans2.get("text", "")  # Text match
-                and abs((date1 - date2).total_seconds()) < 86400  # Same day
-            )
+        def _duplicate_key(trans: Dict) -> Optional[Tuple]:
+            """Build hashable identity key (calendar day, rounded amount, text)."""
+            date = trans.get("date")
+            if not date:
+                return None
+            return (date.date(), round(trans.get("amount", 0), 2), trans.get("text", ""))
+
+        # Index flagged duplicates once so each transaction is an O(1) lookup
+        # instead of a full scan with per-pair datetime/float comparisons
+        duplicate_index = {}
+        for dup_trans, existing, score in duplicates:
+            key = _duplicate_key(dup_trans)
+            if key is not None:
+                duplicate_index.setdefault(key, (existing, score))
+
         for i, trans in enumerate(all_transactions):
-            is_duplicate = any(
-                _transactions_match(dup_trans, trans) and i not in excluded_indices
-                for dup_trans, _, _ in duplicates
+            hit = (
+                duplicate_index.get(_duplicate_key(trans))
+                if i not in excluded_indices
+                else None
             )
 
-            if is_duplicate:
-                dup_trans, existing, score = next(
-                    (d for d in duplicates if _transactions_match(d[0], trans)), (None, None, 0)
-                )
+            if hit:
+                existing, score = hit
                 duplicate_info.append(
                     {
                         "index": i,
@@ -120,7 +126,7 @@ class CompactTransactionProcessor(BaseTransactionProcessor):
         transactions: List[Dict],
         batch_size: int = 20,
         progress_callback: Optional[Callable] = None,
-    ) -> List[Dict]:
+    ) -> List[TransactionResult]:
         """Process transactions with minimal code."""
         if not transactions:
             return []
@@ -131,25 +137,42 @@ class CompactTransactionProcessor(BaseTransactionProcessor):
 
         results = []
         vendor_cache = {}
+        pending_mappings = []
+
+        # Format all dates in one vectorized pass (C path) instead of per row
+        date_strings = pd.to_datetime(
+            [transaction_data["date"] for transaction_data in transactions]
+        ).strftime("%Y-%m-%d")
 
+        # Resolve vendors in a single pass over the vendor_payment subset so the
+        # main loop skips the per-row call for categories that can never match
+        vendor_map = {}
         for i, (transaction_data, batch_result) in enumerate(
             zip(transactions, batch_results)
         ):
-            transaction = self.create_transaction_record(
-                transaction_data, batch_result.category, batch_result.confidence
-            )
+            if batch_result.category == "vendor_payment" and batch_result.vendor_name:
+                vendor, vendor_confidence, _ = self.process_vendor_for_transaction(
+                    batch_result.vendor_name, batch_result.category, vendor_cache, transaction_data
+                )
+                if vendor:
+                    vendor_map[i] = (vendor, vendor_confidence)
 
-            vendor, vendor_confidence = self.process_vendor_for_transaction(
-                batch_result.vendor_name, batch_result.category, vendor_cache, transaction_data
-            )
+        for i, (transaction_data, batch_result) in enumerate(
+            zip(transactions, batch_results)
+        ):
+            vendor, vendor_confidence = vendor_map.get(i, (None, 0.0))
 
-            if vendor:
-                transaction.vendor_id = vendor.id
-                transaction.vendor_confidence = (
+            pending_mappings.append(
+                self.create_transaction_mapping(
+                    transaction_data,
+                    batch_result.category,
+                    batch_result.confidence,
+                    vendor,
                     vendor_confidence * batch_result.vendor_confidence
+                    if vendor
+                    else 0.0,
                 )
-
-            self.db_session.add(transaction)
+            )
             results.append(
                 self.format_transaction_result(
                     transaction_data,
@@ -158,9 +181,12 @@ class CompactTransactionProcessor(BaseTransactionProcessor):
                     vendor,
                     vendor_confidence,
                     "Fast batch processed",
+                    date_str=date_strings[i],
                 )
             )
 
+        # Single Core executemany insert that bypasses the ORM entirely
+        bulk_insert_transactions(self.db_session, pending_mappings)
         self.db_session.commit()
         print(
             f"⚡ Processed {len(results)} transactions with {len(vendor_cache)} vendors!"
@@ -172,7 +198,7 @@ class CompactTransactionProcessor(BaseTransactionProcessor):
         csv_path: str,
         batch_size: int = 20,
         progress_callback: Optional[Callable] = None,
-    ) -> List[Dict]:
+    ) -> List[TransactionResult]:
         """Ultra-fast processing with minimal code."""
         all_transactions = self.read_csv_file(csv_path)
         batch_results = self.categorizer.categorize_batch_ultra_fast(
@@ -181,25 +207,42 @@ class CompactTransactionProcessor(BaseTransactionProcessor):
 
         results = []
         vendor_cache = {}
+        pending_mappings = []
 
+        # Format all dates in one vectorized pass (C path) instead of per row
+        date_strings = pd.to_datetime(
+            [transaction_data["date"] for transaction_data in all_transactions]
+        ).strftime("%Y-%m-%d")
+
+        # Resolve vendors in a single pass over the vendor_payment subset so the
+        # main loop skips the per-row call for categories that can never match
+        vendor_map = {}
         for i, (transaction_data, batch_result) in enumerate(
             zip(all_transactions, batch_results)
         ):
-            transaction = self.create_transaction_record(
-                transaction_data, batch_result.category, batch_result.confidence
-            )
+            if batch_result.category == "vendor_payment" and batch_result.vendor_name:
+                vendor, vendor_confidence, _ = self.process_vendor_for_transaction(
+                    batch_result.vendor_name, batch_result.category, vendor_cache, transaction_data
+                )
+                if vendor:
+                    vendor_map[i] = (vendor, vendor_confidence)
 
-            vendor, vendor_confidence = self.process_vendor_for_transaction(
-                batch_result.vendor_name, batch_result.category, vendor_cache, transaction_data
-            )
+        for i, (transaction_data, batch_result) in enumerate(
+            zip(all_transactions, batch_results)
+        ):
+            vendor, vendor_confidence = vendor_map.get(i, (None, 0.0))
 
-            if vendor:
-                transaction.vendor_id = vendor.id
-                transaction.vendor_confidence = (
+            pending_mappings.append(
+                self.create_transaction_mapping(
+                    transaction_data,
+                    batch_result.category,
+                    batch_result.confidence,
+                    vendor,
                     vendor_confidence * batch_result.vendor_confidence
+                    if vendor
+                    else 0.0,
                 )
-
-            self.db_session.add(transaction)
+            )
             results.append(
                 self.format_transaction_result(
                     transaction_data,
@@ -208,9 +251,12 @@ class CompactTransactionProcessor(BaseTransactionProcessor):
                     vendor,
                     vendor_confidence,
                     "Fast batch processed",
+                    date_str=date_strings[i],
                 )
             )
 
+        # Single Core executemany insert that bypasses the ORM entirely
+        bulk_insert_transactions(self.db_session, pending_mappings)
         self.db_session.commit()
         print(
             f"⚡ ULTRA-FAST: Processed {len(results)} transactions with {len(vendor_cache)} vendors!"
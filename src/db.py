@@ -0,0 +1,39 @@
+# Shared database engine and session factory
+import os
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+# Database file path relative to project structure
+DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'bank_transactions.db')
+os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+
+# Single engine shared by all sessions - avoids re-creating connection pools
+# on every processor construction / Streamlit rerun
+engine = create_engine(
+    f'sqlite:///{DB_PATH}',
+    echo=False,
+    pool_pre_ping=True,
+    connect_args={'check_same_thread': False},  # Sessions are used across Streamlit threads
+)
+
+if engine.dialect.name == 'sqlite':
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Tune SQLite for the write-heavy save path.
+
+        WAL + synchronous=NORMAL turns each commit from a full fsync into an
+        ordered WAL append; temp_store and cache_size keep sorts and hot
+        pages in memory.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA cache_size=-65536')  # 64 MB page cache
+        cursor.execute('PRAGMA mmap_size=268435456')  # Memory-map up to 256 MB of the file
+        cursor.close()
+
+
+# Thread-local session registry bound to the shared engine
+SessionLocal = scoped_session(sessionmaker(bind=engine))
@@ -1,7 +1,7 @@
 # Import SQLAlchemy components for database modeling
-from sqlalchemy import create_engine, Column, String, Float, DateTime, Integer, ForeignKey, Text, text
+from sqlalchemy import Column, String, Float, DateTime, Integer, ForeignKey, Text, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.orm import relationship
 from datetime import datetime
 import os
 
@@ -37,7 +37,7 @@ class Transaction(Base):
 
     # Primary key and core transaction fields from CSV
     id = Column(Integer, primary_key=True)
-    date = Column(DateTime)  # Transaction date
+    date = Column(DateTime, index=True)  # Transaction date
     posting_date = Column(DateTime)  # Bank posting date
     text = Column(Text)  # Transaction description
     message = Column(Text)  # Additional message
@@ -51,11 +51,11 @@ class Transaction(Base):
     balance = Column(Float)  # Account balance after transaction
 
     # AI categorization results
-    category = Column(String(100))  # AI-determined category
+    category = Column(String(100), index=True)  # AI-determined category
     category_confidence = Column(Float)  # Confidence in categorization
 
     # Vendor identification results
-    vendor_id = Column(Integer, ForeignKey('vendors.id'))
+    vendor_id = Column(Integer, ForeignKey('vendors.id'), index=True)
     vendor = relationship("Vendor", back_populates="transactions")
     vendor_confidence = Column(Float)  # Confidence in vendor matching
     vendor_match_source = Column(String(20))  # How vendor was matched: 'cache', 'database', 'llm', or 'none'
@@ -63,7 +63,7 @@ class Transaction(Base):
     # Audit fields
     raw_line = Column(Text)  # Original CSV row data
     created_at = Column(DateTime, default=datetime.utcnow)
-    batch_id = Column(String(36))  # UUID of processing batch for tracking latest processing
+    batch_id = Column(String(36), index=True)  # UUID of processing batch for tracking latest processing
 
 class VendorEnrichment(Base):
     """Track vendor data enrichment from various sources for audit purposes."""
@@ -76,50 +76,69 @@ class VendorEnrichment(Base):
     confidence = Column(Float)  # Confidence in enrichment accuracy
     created_at = Column(DateTime, default=datetime.utcnow)  # When enrichment occurred
 
+def bulk_insert_transactions(session, rows):
+    """Insert transaction row mappings via one Core executemany statement.
+
+    Skips ORM object construction and unit-of-work bookkeeping entirely; the
+    write phase scales with cursor throughput instead of per-row Python
+    attribute instrumentation. Column defaults (created_at) still apply.
+    """
+    if not rows:
+        return
+    session.execute(Transaction.__table__.insert(), rows)
+
 def migrate_database():
     """Add missing columns to existing database."""
-    db_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'bank_transactions.db')
+    from src.db import DB_PATH, engine
 
-    if not os.path.exists(db_path):
+    if not os.path.exists(DB_PATH):
         return  # No existing database to migrate
 
-    engine = create_engine(f'sqlite:///{db_path}', echo=False)
-
-    # Check if columns exist and add them if they don't
+    # Check if columns exist and add them if they don't. One PRAGMA returns
+    # every column, avoiding exception-driven probe SELECTs per column.
     with engine.connect() as conn:
-        try:
-            # Check if vendor_match_source column exists
-            conn.execute(text("SELECT vendor_match_source FROM transactions LIMIT 1"))
-        except Exception:
-            # Column doesn't exist, add it
+        existing_columns = {
+            row[1] for row in conn.execute(text("PRAGMA table_info(transactions)"))
+        }
+        if not existing_columns:
+            return  # Table doesn't exist yet; create_all will build it
+
+        if 'vendor_match_source' not in existing_columns:
             conn.execute(text("ALTER TABLE transactions ADD COLUMN vendor_match_source VARCHAR(20)"))
             conn.commit()
             print("Added vendor_match_source column")
 
-        try:
-            # Check if batch_id column exists
-            conn.execute(text("SELECT batch_id FROM transactions LIMIT 1"))
-        except Exception:
-            # Column doesn't exist, add it
+        if 'batch_id' not in existing_columns:
             conn.execute(text("ALTER TABLE transactions ADD COLUMN batch_id VARCHAR(36)"))
             conn.commit()
             print("Added batch_id column")
 
+        # Indexes on the hot lookup columns; create_all skips indexes for
+        # tables that already exist, so existing databases get them here.
+        # Names match SQLAlchemy's defaults so fresh and migrated DBs agree.
+        for column in ('date', 'category', 'vendor_id', 'batch_id'):
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS ix_transactions_{column} "
+                f"ON transactions ({column})"
+            ))
+        conn.commit()
+
+# Migration and create_all only need to run once per process, not per session
+_schema_ready = False
+
 def get_db_session():
-    """Create and return configured SQLite database session."""
-    # Define database file path relative to project structure
-    db_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'bank_transactions.db')
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    """Return a configured SQLite session from the shared scoped factory."""
+    global _schema_ready
+    from src.db import SessionLocal, engine
 
-    # Create SQLite engine and initialize all tables
-    engine = create_engine(f'sqlite:///{db_path}', echo=False)
+    if not _schema_ready:
+        # Run migration for existing databases
+        migrate_database()
 
-    # Run migration for existing databases
-    migrate_database()
+        # Create all tables (this will create new ones but not modify existing)
+        Base.metadata.create_all(engine)
 
-    # Create all tables (this will create new ones but not modify existing)
-    Base.metadata.create_all(engine)
+        _schema_ready = True
 
     # Return configured session for database operations
-    Session = sessionmaker(bind=engine)
-    return Session()
\ No newline at end of file
+    return SessionLocal()
\ No newline at end of file
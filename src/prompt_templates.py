@@ -5,7 +5,8 @@ from functools import lru_cache
 class PromptTemplates:
     """Centralized prompt templates to eliminate duplication."""
 
-    CATEGORIES = [
+    # Ordered tuple for prompt construction / iteration
+    CATEGORIES = (
         "vendor_payment",  # Payments to vendors/suppliers (includes subscriptions, rent, utilities, services, goods)
         "salary_payment",  # Employee salary and payroll payments
         "customer_payment_received",  # Incoming payments from customers
@@ -13,7 +14,10 @@ class PromptTemplates:
         "bank_fee",  # Bank fees and charges (not payments to vendors)
         "internal_transfer",  # Transfers between own accounts
         "not_categorized",  # Fallback for unclear transactions
-    ]
+    )
+
+    # O(1) membership checks for validating categories coming back from the LLM
+    CATEGORIES_SET = frozenset(CATEGORIES)
 
     @staticmethod
     @lru_cache(maxsize=1)
@@ -119,6 +123,23 @@ Important notes:
 
 If this appears to be an unknown or very small company, still provide your best analysis based on the name and any context clues."""
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def get_batch_prompt_suffix() -> str:
+        """Static tail of the batch categorization prompt, built once.
+
+        Everything after the per-batch transaction JSON is constant, so the
+        multi-KB block (category list, rules, output schema) is assembled a
+        single time instead of on every API call.
+        """
+        return f"""Note: D=DEBIT/Outgoing, C=CREDIT/Incoming
+
+Categories: {", ".join(PromptTemplates.CATEGORIES)}
+
+{PromptTemplates.get_batch_processing_rules()}
+
+Return JSON: {{"results": [{{"transaction_id": 0, "category": "vendor_payment", "confidence": 0.9, "vendor_name": "Stripe", "vendor_confidence": 0.8}}]}}"""
+
     @staticmethod
     @lru_cache(maxsize=1)
     def get_batch_processing_rules() -> str:
@@ -1,14 +1,25 @@
 # Streamlined categorizer with reduced code length
-import hashlib
-import json
+import asyncio
+import logging
 import os
+import re
+import socket
 import time
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+import orjson
+import redis
 import requests
+import xxhash
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from dotenv import load_dotenv
-from openai import OpenAI
-from pydantic import BaseModel
+from functools import lru_cache
+from openai import AsyncOpenAI, OpenAI
+from pydantic import BaseModel, ConfigDict
+from requests.adapters import HTTPAdapter
 
 try:
     import anthropic
@@ -18,24 +29,195 @@ except ImportError:
     ANTHROPIC_AVAILABLE = False
 
 from src.prompt_templates import PromptTemplates
-from src.confidence_calculator import ConfidenceCalculator
+from src.confidence_calculator import (
+    ConfidenceCalculator,
+    transaction_text,
+    transactions_to_columns,
+)
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Shared pool for parallel domain probes; network-bound, so wall time per
+# vendor drops from the sum of candidate latencies to the slowest one
+_DOMAIN_EXECUTOR = ThreadPoolExecutor(max_workers=16)
+
+# Sync SDK clients keyed by API key, shared across categorizer instances:
+# each client owns an HTTP connection pool and parsed-model state, so a
+# Celery worker running thousands of tasks reuses one instead of rebuilding
+# per task. Async clients are deliberately NOT cached here — their httpx
+# pools bind to the event loop they were created under, and each
+# asyncio.run() call uses a fresh loop, so a shared client would raise
+# "Event loop is closed" on every run after the first.
+_OPENAI_CLIENTS: Dict[str, OpenAI] = {}
+_ANTHROPIC_CLIENTS: Dict[str, object] = {}
+
+
+def _shared_client(cache: Dict, api_key: Optional[str], factory):
+    """Return the per-key singleton from cache, creating it on first use."""
+    key = api_key or ""
+    client = cache.get(key)
+    if client is None:
+        client = factory(api_key)
+        cache[key] = client
+    return client
+
+# Single-transaction prompt templates, assembled once at import with the
+# static rule blocks baked in; per call only the transaction fields are
+# formatted instead of rebuilding the multi-KB string
+_CATEGORIZE_PROMPT = """As a financial transaction analyst, categorize this bank transaction by analyzing the vendor/company and understanding what the payment represents.
+
+Transaction details:
+- Date: {date}
+- Text: {text}
+- Message: {message}
+- Type: {transaction_type}
+- Amount: {amount} {currency} ({direction})
+- Sender: {sender}
+- Receiver: {receiver}
+
+""" + PromptTemplates.get_categorization_rules() + """
+
+Return a JSON object with:
+- category: the most appropriate category from the list above
+- confidence: float between 0 and 1 (how certain you are)
+- reasoning: detailed explanation of your analysis and decision"""
+
+_IDENTIFY_VENDOR_PROMPT = """As a financial analyst, extract the vendor/company name from this bank transaction by analyzing all available text fields.
+
+Transaction details:
+- Text: {text}
+- Message: {message}
+- Sender: {sender}
+- Receiver: {receiver}
+- Amount: {amount} {currency}
+
+""" + PromptTemplates.get_vendor_identification_rules() + """
+
+Return a JSON object with:
+- vendor_name: cleaned, canonical company name (or null if no clear vendor found)
+- confidence: float between 0 and 1 (how certain you are this is correct)
+- reasoning: explain what you found and how you cleaned/identified the name"""
+
+_ENRICH_VENDOR_PROMPT = """As a business intelligence analyst, research and provide comprehensive information about this vendor/company: {vendor_name}
+
+Analyze what type of business this is, what they sell/provide, and determine if they primarily deal in services or goods.
+
+""" + PromptTemplates.get_vendor_enrichment_rules()
+
+@lru_cache(maxsize=512)
+def _company_name_words(company_name: str) -> Tuple[Tuple[str, ...], int]:
+    """Tokenize a company name for content scoring, memoized per vendor.
+
+    Returns the words worth scanning for (longer than 2 chars, lowercased)
+    and the total word count used as the score denominator.
+    """
+    name_words = company_name.lower().split()
+    return (
+        tuple(word for word in name_words if len(word) > 2),
+        len(name_words),
+    )
+
+
+# Semantic cache tuning: numbers (amounts, dates, references) are masked so
+# recurring charges for the same vendor collide on the same normalized text
+_NUMBER_RE = re.compile(r"\d+[\d.,/:-]*")
+
+# Domain probes only need the top of the page (title/meta) for name matching
+_PROBE_MAX_BYTES = 32 * 1024
+
+# Merchants whose presence in a debit's text settles the category without an
+# LLM call: uppercase needle -> canonical vendor name. All are unambiguous
+# vendor_payment cases; credits are excluded (Stripe/PayPal inflows are
+# customer payments) and ambiguous strings stay off the list on purpose.
+KNOWN_MERCHANTS = {
+    "STRIPE": "Stripe",
+    "AMAZON WEB SERVICES": "Amazon Web Services",
+    "AWS EMEA": "Amazon Web Services",
+    "GITHUB": "GitHub",
+    "LINKEDIN": "LinkedIn",
+    "GOOGLE CLOUD": "Google Cloud",
+    "GSUITE": "Google Workspace",
+    "GOOGLE WORKSPACE": "Google Workspace",
+    "MICROSOFT": "Microsoft",
+    "SLACK": "Slack",
+    "ZOOM.US": "Zoom",
+    "DROPBOX": "Dropbox",
+    "ATLASSIAN": "Atlassian",
+    "NOTION": "Notion",
+    "FIGMA": "Figma",
+    "ADOBE": "Adobe",
+    "OPENAI": "OpenAI",
+    "ANTHROPIC": "Anthropic",
+    "CLAUDE.AI": "Claude AI",
+    "MAILCHIMP": "Mailchimp",
+    "SENTRY": "Sentry",
+    "HEROKU": "Heroku",
+    "DIGITALOCEAN": "DigitalOcean",
+    "CLOUDFLARE": "Cloudflare",
+    "TWILIO": "Twilio",
+    "HUBSPOT": "HubSpot",
+    "SHOPIFY": "Shopify",
+    "SQUARESPACE": "Squarespace",
+    "CANVA": "Canva",
+    "ASANA": "Asana",
+    "TRELLO": "Trello",
+    "INTERCOM": "Intercom",
+    "ZENDESK": "Zendesk",
+    "METABASE": "Metabase",
+}
+
+# Longest-first alternation so "AMAZON WEB SERVICES" wins over any shorter
+# overlapping needle; one C-level scan per transaction
+_MERCHANT_RE = re.compile(
+    "|".join(
+        sorted((re.escape(needle) for needle in KNOWN_MERCHANTS), key=len, reverse=True)
+    )
+)
+
+
+def _match_known_merchant(transaction: Dict) -> Optional[str]:
+    """Return the canonical vendor name when a known merchant settles this row.
+
+    Only debits qualify: an outgoing payment to a known SaaS/infrastructure
+    merchant is vendor_payment by definition, while incoming amounts from
+    the same names (e.g. Stripe payouts) are customer payments and must
+    still go to the LLM.
+    """
+    if transaction.get("amount", 0) >= 0:
+        return None
+    haystack = (
+        f"{transaction.get('text', '')} {transaction.get('sender', '')} "
+        f"{transaction.get('receiver', '')}"
+    ).upper()
+    match = _MERCHANT_RE.search(haystack)
+    return KNOWN_MERCHANTS[match.group(0)] if match else None
+
+
+_SEMANTIC_SIM_THRESHOLD = 0.92
+_SEMANTIC_MAX_ENTRIES = 2048
+
 
 class TransactionCategory(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     category: str
     confidence: float
     reasoning: str
 
 
 class VendorIdentification(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     vendor_name: Optional[str]
     confidence: float
     reasoning: str
 
 
 class VendorInfo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     nicknames: List[str]
     domain: Optional[str]
@@ -46,7 +228,12 @@ class VendorInfo(BaseModel):
     confidence: float
 
 
-class FastBatchResult(BaseModel):
+@dataclass(slots=True)
+class FastBatchResult:
+    """Per-row batch result; built in bulk on the hot path, so a slots
+    dataclass skips pydantic validation the data (our own parsed JSON)
+    doesn't need."""
+
     transaction_id: int
     category: str
     confidence: float
@@ -59,50 +246,179 @@ class StreamlinedCategorizer:
 
     def __init__(self, api_key: Optional[str] = None, verify_domains: bool = True):
         self.api_key = api_key
-        self.client = OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
+        resolved_key = api_key or os.getenv("OPENAI_API_KEY")
+        self._resolved_key = resolved_key
+        self.client = _shared_client(
+            _OPENAI_CLIENTS, resolved_key, lambda key: OpenAI(api_key=key)
+        )
+        # Created per asyncio.run() invocation (see
+        # categorize_batch_ultra_fast); never shared across event loops
+        self.async_client: Optional[AsyncOpenAI] = None
         self.anthropic_client = None
         self.model = "gpt-4o-mini"
         self.provider = "OpenAI"
         self.verify_domains = verify_domains
 
-        # Initialize caches for performance optimization
-        self._vendor_cache = {}
-        self._domain_cache = {}
-        self._prompt_cache = {}
+        # Initialize caches for performance optimization. TTLCache keeps
+        # them bounded and evicts expired entries itself, so long-lived
+        # Celery workers no longer accumulate stale responses
         self._cache_ttl = 3600  # 1 hour TTL for cached items
+        self._vendor_cache = TTLCache(maxsize=10_000, ttl=self._cache_ttl)
+        self._domain_cache = TTLCache(maxsize=10_000, ttl=self._cache_ttl)
+        self._prompt_cache = TTLCache(maxsize=10_000, ttl=self._cache_ttl)
+
+        # Reverse index vendor -> probed domains so enrichment fallbacks don't
+        # scan the whole domain cache per vendor
+        self._vendor_to_domains = {}
+
+        # Optional Redis tier behind the in-memory caches: calls here are
+        # deterministic (temperature 0.1), so results survive worker restarts
+        # and are shared across Celery workers. Falls back to memory-only.
+        self._redis = None
+        try:
+            client = redis.Redis.from_url(
+                os.getenv("REDIS_URL", os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0"))
+            )
+            client.ping()
+            self._redis = client
+        except Exception:
+            pass
+
+        # Semantic cache: embeddings of number-masked prompts plus their
+        # results, so near-duplicate transactions (same vendor, different
+        # amount/date) reuse an answer a cheap embedding call can find
+        self._semantic_vectors = None  # (N, dim) float32, rows L2-normalized
+        self._semantic_results = []
+
+        # Pooled HTTP session: keep-alive connections for domain verification
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50)
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
 
         # Initialize confidence calculator
         self.confidence_calc = ConfidenceCalculator()
 
         if ANTHROPIC_AVAILABLE:
             try:
-                self.anthropic_client = anthropic.Anthropic(
-                    api_key=api_key or os.getenv("ANTHROPIC_API_KEY")
+                self.anthropic_client = _shared_client(
+                    _ANTHROPIC_CLIENTS,
+                    api_key or os.getenv("ANTHROPIC_API_KEY"),
+                    lambda key: anthropic.Anthropic(api_key=key),
                 )
             except Exception:
                 pass
 
     def _get_cache_key(self, prompt: str, system_message: str = None) -> str:
-        """Generate cache key for API calls."""
-        content = f"{system_message or ''}||{prompt}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
-
-    def _is_cache_expired(self, timestamp: float) -> bool:
-        """Check if cached item has expired."""
-        return time.time() - timestamp > self._cache_ttl
-
-    def _make_api_call(self, prompt: str, system_message: str = None) -> dict:
-        """Unified API call method with caching to eliminate duplication and reduce API costs."""
-        # Check cache first for repeated calls
+        """Generate cache key for API calls.
+
+        xxh3 instead of SHA-256: the key only needs to be collision-free
+        across cached prompts, not cryptographic, and xxh3 hashes multi-KB
+        batch prompts several times faster. 64 bits is still 16 hex chars,
+        matching the old truncated digest length.
+        """
+        # Feed the parts into the hash incrementally; concatenating first
+        # would allocate a string the size of both (tens of KB for batch
+        # prompts) just to throw it away
+        h = xxhash.xxh3_64()
+        h.update((system_message or "").encode())
+        h.update(b"||")
+        h.update(prompt.encode())
+        return h.hexdigest()
+
+    def _embed_prompt(self, prompt: str) -> Optional[np.ndarray]:
+        """Embed the number-masked prompt; None when embeddings are unavailable."""
+        try:
+            response = self.client.embeddings.create(
+                model="text-embedding-3-small",
+                input=_NUMBER_RE.sub("#", prompt)[:2000],
+            )
+            vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            return vector / norm if norm else None
+        except Exception:
+            return None
+
+    def _semantic_lookup(self, prompt: str) -> Tuple[Optional[np.ndarray], Optional[dict]]:
+        """Find a cached result for a near-duplicate prompt.
+
+        Returns (query_vector, result). The vector is handed back so a miss
+        followed by a fresh LLM call can be stored without re-embedding.
+        """
+        query = self._embed_prompt(prompt)
+        if query is None or self._semantic_vectors is None:
+            return query, None
+
+        similarities = self._semantic_vectors @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] >= _SEMANTIC_SIM_THRESHOLD:
+            return query, self._semantic_results[best]
+        return query, None
+
+    def _semantic_store(self, query: Optional[np.ndarray], result: dict) -> None:
+        """Add an embedding/result pair, evicting oldest rows beyond the cap."""
+        if query is None or not result:
+            return
+        if self._semantic_vectors is None:
+            self._semantic_vectors = query[np.newaxis, :]
+        else:
+            self._semantic_vectors = np.vstack([self._semantic_vectors, query])
+            if len(self._semantic_results) >= _SEMANTIC_MAX_ENTRIES:
+                self._semantic_vectors = self._semantic_vectors[1:]
+                self._semantic_results.pop(0)
+        self._semantic_results.append(result)
+
+    def _redis_get(self, key: str):
+        """Fetch a JSON value from the Redis tier; None on miss or any error."""
+        if self._redis is None:
+            return None
+        try:
+            raw = self._redis.get(key)
+            return orjson.loads(raw) if raw else None
+        except Exception:
+            return None
+
+    def _redis_set(self, key: str, value) -> None:
+        """Store a JSON value in the Redis tier with the shared TTL."""
+        if self._redis is None:
+            return
+        try:
+            self._redis.setex(key, self._cache_ttl, orjson.dumps(value))
+        except Exception:
+            pass
+
+    def _make_api_call(
+        self, prompt: str, system_message: str = None, semantic: bool = True
+    ) -> dict:
+        """Unified API call method with caching to eliminate duplication and reduce API costs.
+
+        semantic=False skips the embedding tier; batch prompts pass it
+        because number-masking erases the transaction ids that keep two
+        different batches distinct, so a near-duplicate hit there would
+        return another batch's per-row results.
+        """
+        # Check cache first for repeated calls (TTLCache drops expired entries)
         cache_key = self._get_cache_key(prompt, system_message)
-        if cache_key in self._prompt_cache:
-            cached_item = self._prompt_cache[cache_key]
-            if not self._is_cache_expired(cached_item["timestamp"]):
-                print("[CACHE HIT] Using cached result for API call")
-                return cached_item["data"]
-            else:
-                # Clean up expired cache entry
-                del self._prompt_cache[cache_key]
+        cached = self._prompt_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("[CACHE HIT] Using cached result for API call")
+            return cached
+
+        cached = self._redis_get(f"prompt:{cache_key}")
+        if cached is not None:
+            logger.debug("[CACHE HIT] Using cached result for API call")
+            self._prompt_cache[cache_key] = cached
+            return cached
+
+        # Exact keys miss on prompts differing only in amounts/dates; a cheap
+        # embedding lookup catches those near-duplicates
+        semantic_query, semantic_hit = (
+            self._semantic_lookup(prompt) if semantic else (None, None)
+        )
+        if semantic_hit is not None:
+            logger.debug("[CACHE HIT] Using semantically similar cached result")
+            self._prompt_cache[cache_key] = semantic_hit
+            return semantic_hit
 
         try:
             if self.provider == "Anthropic" and self.anthropic_client:
@@ -117,7 +433,7 @@ class StreamlinedCategorizer:
                         }
                     ],
                 )
-                result = json.loads(response.content[0].text)
+                result = orjson.loads(response.content[0].text)
             else:
                 messages = [{"role": "user", "content": prompt}]
                 if system_message:
@@ -129,38 +445,99 @@ class StreamlinedCategorizer:
                     response_format={"type": "json_object"},
                     temperature=0.1,
                 )
-                result = json.loads(response.choices[0].message.content)
+                result = orjson.loads(response.choices[0].message.content)
+
+            # Cache the successful result in all tiers
+            self._prompt_cache[cache_key] = result
+            self._redis_set(f"prompt:{cache_key}", result)
+            self._semantic_store(semantic_query, result)
+
+            return result
+        except Exception as e:
+            logger.warning("API call error: %s", e)
+            return {}
 
-            # Cache the successful result
-            self._prompt_cache[cache_key] = {"data": result, "timestamp": time.time()}
+    async def _make_api_call_async(
+        self, prompt: str, system_message: str = None, semantic: bool = True
+    ) -> dict:
+        """Non-blocking variant of _make_api_call sharing the same cache."""
+        cache_key = self._get_cache_key(prompt, system_message)
+        cached = self._prompt_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("[CACHE HIT] Using cached result for API call")
+            return cached
+
+        cached = self._redis_get(f"prompt:{cache_key}")
+        if cached is not None:
+            logger.debug("[CACHE HIT] Using cached result for API call")
+            self._prompt_cache[cache_key] = cached
+            return cached
+
+        # Embedding lookup runs in a worker thread to keep the loop free
+        if semantic:
+            semantic_query, semantic_hit = await asyncio.to_thread(
+                self._semantic_lookup, prompt
+            )
+        else:
+            semantic_query, semantic_hit = None, None
+        if semantic_hit is not None:
+            logger.debug("[CACHE HIT] Using semantically similar cached result")
+            self._prompt_cache[cache_key] = semantic_hit
+            return semantic_hit
+
+        if self.provider == "Anthropic" and self.anthropic_client:
+            # The Anthropic client here is sync-only; keep it off the event loop
+            return await asyncio.to_thread(
+                self._make_api_call, prompt, system_message, semantic
+            )
+
+        try:
+            messages = [{"role": "user", "content": prompt}]
+            if system_message:
+                messages.insert(0, {"role": "system", "content": system_message})
+
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                response_format={"type": "json_object"},
+                temperature=0.1,
+            )
+            result = orjson.loads(response.choices[0].message.content)
+
+            self._prompt_cache[cache_key] = result
+            self._redis_set(f"prompt:{cache_key}", result)
+            self._semantic_store(semantic_query, result)
 
             return result
         except Exception as e:
-            print(f"API call error: {e}")
+            logger.warning("API call error: %s", e)
             return {}
 
     def categorize_transaction(self, transaction: Dict) -> TransactionCategory:
         """Categorize a single transaction."""
+        # Known-merchant debits are settled by a string match; no LLM call
+        known_vendor = _match_known_merchant(transaction)
+        if known_vendor is not None:
+            return TransactionCategory(
+                category="vendor_payment",
+                confidence=1.0,
+                reasoning=f"Known merchant match: {known_vendor}",
+            )
+
         amount = transaction.get("amount", 0)
         is_debit = amount < 0
 
-        prompt = f"""As a financial transaction analyst, categorize this bank transaction by analyzing the vendor/company and understanding what the payment represents.
-
-Transaction details:
-- Date: {transaction.get("date")}
-- Text: {transaction.get("text")}
-- Message: {transaction.get("message")}
-- Type: {transaction.get("transaction_type")}
-- Amount: {amount} {transaction.get("currency")} ({"DEBIT/Outgoing" if is_debit else "CREDIT/Incoming"})
-- Sender: {transaction.get("sender")}
-- Receiver: {transaction.get("receiver")}
-
-{PromptTemplates.get_categorization_rules()}
-
-Return a JSON object with:
-- category: the most appropriate category from the list above
-- confidence: float between 0 and 1 (how certain you are)
-- reasoning: detailed explanation of your analysis and decision"""
+        prompt = _CATEGORIZE_PROMPT.format(
+            date=transaction.get("date"),
+            text=transaction.get("text"),
+            message=transaction.get("message"),
+            transaction_type=transaction.get("transaction_type"),
+            amount=amount,
+            currency=transaction.get("currency"),
+            direction="DEBIT/Outgoing" if is_debit else "CREDIT/Incoming",
+            sender=transaction.get("sender"),
+            receiver=transaction.get("receiver"),
+        )
 
         result = self._make_api_call(
             prompt, "You are a financial transaction categorization expert."
@@ -186,21 +563,14 @@ Return a JSON object with:
 
     def identify_vendor(self, transaction: Dict) -> VendorIdentification:
         """Identify vendor from transaction."""
-        prompt = f"""As a financial analyst, extract the vendor/company name from this bank transaction by analyzing all available text fields.
-
-Transaction details:
-- Text: {transaction.get("text")}
-- Message: {transaction.get("message")}
-- Sender: {transaction.get("sender")}
-- Receiver: {transaction.get("receiver")}
-- Amount: {transaction.get("amount")} {transaction.get("currency")}
-
-{PromptTemplates.get_vendor_identification_rules()}
-
-Return a JSON object with:
-- vendor_name: cleaned, canonical company name (or null if no clear vendor found)
-- confidence: float between 0 and 1 (how certain you are this is correct)
-- reasoning: explain what you found and how you cleaned/identified the name"""
+        prompt = _IDENTIFY_VENDOR_PROMPT.format(
+            text=transaction.get("text"),
+            message=transaction.get("message"),
+            sender=transaction.get("sender"),
+            receiver=transaction.get("receiver"),
+            amount=transaction.get("amount"),
+            currency=transaction.get("currency"),
+        )
 
         result = self._make_api_call(
             prompt,
@@ -226,19 +596,19 @@ Return a JSON object with:
         """Enrich vendor information with caching for repeated lookups."""
         # Check vendor cache first
         cache_key = vendor_name.lower().strip()
-        if cache_key in self._vendor_cache:
-            cached_item = self._vendor_cache[cache_key]
-            if not self._is_cache_expired(cached_item["timestamp"]):
-                print(f"[CACHE HIT] Using cached vendor info for {vendor_name}")
-                return cached_item["data"]
-            else:
-                del self._vendor_cache[cache_key]
+        cached = self._vendor_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("[CACHE HIT] Using cached vendor info for %s", vendor_name)
+            return cached
 
-        prompt = f"""As a business intelligence analyst, research and provide comprehensive information about this vendor/company: {vendor_name}
+        cached = self._redis_get(f"vendor:{cache_key}")
+        if cached is not None:
+            logger.debug("[CACHE HIT] Using cached vendor info for %s", vendor_name)
+            vendor_info = VendorInfo(**cached)
+            self._vendor_cache[cache_key] = vendor_info
+            return vendor_info
 
-Analyze what type of business this is, what they sell/provide, and determine if they primarily deal in services or goods.
-
-{PromptTemplates.get_vendor_enrichment_rules()}"""
+        prompt = _ENRICH_VENDOR_PROMPT.format(vendor_name=vendor_name)
 
         result = self._make_api_call(
             prompt, "You are an expert on company information and business operations."
@@ -288,34 +658,37 @@ Analyze what type of business this is, what they sell/provide, and determine if
                 # This handles cases where AI returns a single invalid domain but we have valid ones cached
                 valid_domain = None
 
-                # Check if we have any valid domains in cache for this vendor
-                for cache_key, cached_item in self._domain_cache.items():
-                    if (
-                        cache_key.endswith(f"||{vendor_name.lower()}")
-                        and not self._is_cache_expired(cached_item["timestamp"])
-                        and cached_item["data"][0]
-                    ):
-                        # Extract domain from cache key
-                        domain_from_cache = cache_key.split("||")[0]
-                        valid_domain = domain_from_cache
+                # Check if we have any valid domains cached for this vendor;
+                # the reverse index makes this O(candidates), not O(cache)
+                for known_domain in self._vendor_to_domains.get(vendor_name.lower(), []):
+                    cached = self._domain_cache.get(
+                        f"{known_domain}||{vendor_name.lower()}"
+                    )
+                    if cached is not None and cached[0]:
+                        valid_domain = known_domain
                         break
 
-                # If no cached domain found, try common domain variations
+                # If no cached domain found, try common domain variations.
+                # A seen-set dedupes candidates and skips the domain that
+                # already failed, so each variant is probed at most once
+                # (and the DNS pre-check in _probe_domain makes dead
+                # variants cheap).
                 if not valid_domain and domain:
                     base_domain = domain.split(".")[0] if "." in domain else domain
-                    common_tlds = [".ai", ".com", ".io", ".co", ".net", ".org"]
+                    common_tlds = (".ai", ".com", ".io", ".co", ".net", ".org")
 
+                    tried_domains = {domain.lower()}
                     for tld in common_tlds:
-                        if (
-                            tld != domain.split(".")[-1] if "." in domain else ".com"
-                        ):  # Don't retry the same TLD
-                            test_domain = f"{base_domain}{tld}"
-                            test_valid, _ = self._verify_domain(
-                                test_domain, vendor_name
-                            )
-                            if test_valid:
-                                valid_domain = test_domain
-                                break
+                        test_domain = f"{base_domain}{tld}"
+                        if test_domain.lower() in tried_domains:
+                            continue
+                        tried_domains.add(test_domain.lower())
+                        test_valid, _ = self._verify_domain(
+                            test_domain, vendor_name
+                        )
+                        if test_valid:
+                            valid_domain = test_domain
+                            break
 
                 if valid_domain:
                     result["domain"] = valid_domain
@@ -334,14 +707,10 @@ Analyze what type of business this is, what they sell/provide, and determine if
                             f"{single_domain.lower()}||{vendor_name.lower()}",
                         ]
                         for cache_key in cache_keys_to_try:
-                            if cache_key in self._domain_cache:
-                                cached_item = self._domain_cache[cache_key]
-                                if (
-                                    not self._is_cache_expired(cached_item["timestamp"])
-                                    and cached_item["data"][0]
-                                ):
-                                    valid_domain = single_domain
-                                    break
+                            cached = self._domain_cache.get(cache_key)
+                            if cached is not None and cached[0]:
+                                valid_domain = single_domain
+                                break
                         if valid_domain:
                             break
 
@@ -351,104 +720,517 @@ Analyze what type of business this is, what they sell/provide, and determine if
 
         vendor_info = VendorInfo(**result)
 
-        # Cache the vendor info for future lookups
-        self._vendor_cache[cache_key] = {"data": vendor_info, "timestamp": time.time()}
+        # Cache the vendor info for future lookups in both tiers
+        self._vendor_cache[cache_key] = vendor_info
+        self._redis_set(f"vendor:{cache_key}", vendor_info.model_dump())
 
         return vendor_info
 
     def categorize_batch_ultra_fast(
-        self, transactions: List[Dict], batch_size: int = 20, progress_callback=None
+        self,
+        transactions: List[Dict],
+        batch_size: int = 20,
+        progress_callback=None,
+        use_batch_api: bool = False,
+    ) -> List[FastBatchResult]:
+        """Ultra-fast batch processing with concurrent API calls.
+
+        Sync wrapper over the async implementation; callers (Celery tasks,
+        Streamlit) stay synchronous while the batches fly in parallel.
+
+        With use_batch_api=True the requests go through the OpenAI Batch API
+        instead: half the token cost and no rate-limit pressure, at the price
+        of polling until the job completes. Only worth it for background
+        (Celery) runs where latency is already expected to be minutes.
+        """
+        if use_batch_api:
+            return self.categorize_batch_via_batch_api(
+                transactions, batch_size=batch_size, progress_callback=progress_callback
+            )
+        async def run_with_fresh_client():
+            # The async client must live and die with this event loop: its
+            # httpx keep-alive connections are bound to the loop they were
+            # opened under, so reusing one across asyncio.run() calls fails
+            # with "Event loop is closed" on the second run
+            self.async_client = AsyncOpenAI(api_key=self._resolved_key)
+            try:
+                return await self.categorize_batch_ultra_fast_async(
+                    transactions,
+                    batch_size=batch_size,
+                    progress_callback=progress_callback,
+                )
+            finally:
+                await self.async_client.close()
+                self.async_client = None
+
+        return asyncio.run(run_with_fresh_client())
+
+    def categorize_batch_via_batch_api(
+        self,
+        transactions: List[Dict],
+        batch_size: int = 20,
+        progress_callback=None,
+        poll_interval: float = 5.0,
     ) -> List[FastBatchResult]:
-        """Ultra-fast batch processing with minimal code."""
+        """Categorize via one OpenAI Batch API job instead of live calls.
+
+        All batch prompts are written into a single JSONL upload, one
+        /v1/chat/completions request per line keyed by custom_id, then the
+        job is polled until a terminal status. Results land in the same
+        prompt caches as the live path, so batch and interactive runs share
+        hits. Failed or missing lines fall back per row like parse errors do.
+        """
+        batches = [
+            (offset, transactions[offset : offset + batch_size])
+            for offset in range(0, len(transactions), batch_size)
+        ]
+        if not batches:
+            return []
+
+        # Resolve cached batches up front; only misses go into the job
+        results_by_offset = {}
+        pending = []
+        for offset, batch in batches:
+            prompt = self._build_batch_prompt(batch, offset)
+            cache_key = self._get_cache_key(prompt, self._BATCH_SYSTEM_MESSAGE)
+            cached = self._prompt_cache.get(cache_key)
+            if cached is None:
+                cached = self._redis_get(f"prompt:{cache_key}")
+            if cached is not None:
+                results_by_offset[offset] = self._parse_batch_result(
+                    batch, offset, cached
+                )
+            else:
+                pending.append((offset, batch, prompt, cache_key))
+
+        if pending:
+            lines = [
+                orjson.dumps(
+                    {
+                        "custom_id": f"batch-{offset}",
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": self.model,
+                            "messages": [
+                                {
+                                    "role": "system",
+                                    "content": self._BATCH_SYSTEM_MESSAGE,
+                                },
+                                {"role": "user", "content": prompt},
+                            ],
+                            "response_format": {"type": "json_object"},
+                            "temperature": 0.1,
+                        },
+                    }
+                )
+                for offset, _, prompt, _ in pending
+            ]
+
+            try:
+                input_file = self.client.files.create(
+                    file=("batch_requests.jsonl", b"\n".join(lines)),
+                    purpose="batch",
+                )
+                job = self.client.batches.create(
+                    input_file_id=input_file.id,
+                    endpoint="/v1/chat/completions",
+                    completion_window="24h",
+                )
+
+                while job.status not in ("completed", "failed", "expired", "cancelled"):
+                    if progress_callback:
+                        counts = getattr(job, "request_counts", None)
+                        done = counts.completed if counts else 0
+                        progress_callback(
+                            20 + int(done / len(pending) * 60),
+                            f"Batch job {job.status}: {done}/{len(pending)} requests done",
+                        )
+                    time.sleep(poll_interval)
+                    job = self.client.batches.retrieve(job.id)
+
+                batch_by_offset = {
+                    offset: (batch, cache_key)
+                    for offset, batch, _, cache_key in pending
+                }
+                if job.status == "completed" and job.output_file_id:
+                    raw = self.client.files.content(job.output_file_id).content
+                    for line in raw.splitlines():
+                        if not line.strip():
+                            continue
+                        record = orjson.loads(line)
+                        offset = int(record["custom_id"].split("-", 1)[1])
+                        batch, cache_key = batch_by_offset[offset]
+                        response = record.get("response") or {}
+                        if record.get("error") or response.get("status_code") != 200:
+                            continue
+                        result = orjson.loads(
+                            response["body"]["choices"][0]["message"]["content"]
+                        )
+                        self._prompt_cache[cache_key] = result
+                        self._redis_set(f"prompt:{cache_key}", result)
+                        results_by_offset[offset] = self._parse_batch_result(
+                            batch, offset, result
+                        )
+                else:
+                    logger.warning("Batch API job ended with status: %s", job.status)
+            except Exception as e:
+                logger.warning("Batch API error: %s", e)
+
+        # Stitch per-batch results back in offset order; anything the job
+        # didn't answer gets per-row fallback confidence like parse errors
         results = []
-        total_batches = (len(transactions) + batch_size - 1) // batch_size
+        for offset, batch in batches:
+            batch_results = results_by_offset.get(offset)
+            if batch_results is None:
+                batch_results = [
+                    FastBatchResult(
+                        transaction_id=offset + index,
+                        category="other",
+                        confidence=self.confidence_calc.calculate_llm_fallback_confidence(
+                            txn, "other"
+                        ),
+                    )
+                    for index, txn in enumerate(batch)
+                ]
+            results.extend(batch_results)
+        return results
 
-        for i in range(0, len(transactions), batch_size):
-            batch = transactions[i : i + batch_size]
-            batch_num = i // batch_size + 1
+    async def categorize_batch_ultra_fast_async(
+        self,
+        transactions: List[Dict],
+        batch_size: int = 20,
+        max_concurrency: int = 8,
+        progress_callback=None,
+    ) -> List[FastBatchResult]:
+        """Issue all batch API calls concurrently on one event loop.
+
+        Batches are independent and the workload is pure IO, so wall time
+        drops from sum of latencies to roughly the slowest batch. A bounded
+        semaphore keeps concurrent requests within API rate limits; gather
+        preserves batch order in the combined result.
+
+        Recurring rows (same text/sender/message and direction) are collapsed
+        before anything is sent: only one representative per group goes to
+        the LLM and its result is fanned back out, so token spend scales with
+        unique transactions rather than CSV length. Before any of that,
+        debits matching a known merchant are settled by string match alone
+        and only the remainder is sent on.
+        """
+        known = {
+            index: vendor_name
+            for index, txn in enumerate(transactions)
+            if (vendor_name := _match_known_merchant(txn)) is not None
+        }
+        if known:
+            unresolved = [
+                txn for index, txn in enumerate(transactions) if index not in known
+            ]
+            unresolved_results = await self.categorize_batch_ultra_fast_async(
+                unresolved,
+                batch_size=batch_size,
+                max_concurrency=max_concurrency,
+                progress_callback=progress_callback,
+            )
+            merged = []
+            unresolved_iter = iter(unresolved_results)
+            for index, txn in enumerate(transactions):
+                vendor_name = known.get(index)
+                if vendor_name is not None:
+                    merged.append(
+                        FastBatchResult(
+                            transaction_id=index,
+                            category="vendor_payment",
+                            confidence=1.0,
+                            vendor_name=vendor_name,
+                            vendor_confidence=self.confidence_calc.calculate_vendor_confidence(
+                                vendor_name, txn, 0.9
+                            ),
+                        )
+                    )
+                else:
+                    rest = next(unresolved_iter)
+                    merged.append(
+                        FastBatchResult(
+                            transaction_id=index,
+                            category=rest.category,
+                            confidence=rest.confidence,
+                            vendor_name=rest.vendor_name,
+                            vendor_confidence=rest.vendor_confidence,
+                        )
+                    )
+            return merged
+
+        group_keys = [
+            (
+                txn.get("text", ""),
+                txn.get("sender", ""),
+                txn.get("message", ""),
+                "D" if txn.get("amount", 0) < 0 else "C",
+            )
+            for txn in transactions
+        ]
+        key_to_representative = {}
+        representatives = []
+        for index, key in enumerate(group_keys):
+            if key not in key_to_representative:
+                key_to_representative[key] = len(representatives)
+                representatives.append(transactions[index])
+
+        if len(representatives) < len(transactions):
+            representative_results = await self.categorize_batch_ultra_fast_async(
+                representatives,
+                batch_size=batch_size,
+                max_concurrency=max_concurrency,
+                progress_callback=progress_callback,
+            )
+            results_by_id = {r.transaction_id: r for r in representative_results}
+            fallback = FastBatchResult(
+                transaction_id=0, category="other", confidence=0.0
+            )
+            fanned_out = []
+            for index, key in enumerate(group_keys):
+                rep = results_by_id.get(key_to_representative[key], fallback)
+                fanned_out.append(
+                    FastBatchResult(
+                        transaction_id=index,
+                        category=rep.category,
+                        confidence=rep.confidence,
+                        vendor_name=rep.vendor_name,
+                        vendor_confidence=rep.vendor_confidence,
+                    )
+                )
+            return fanned_out
+
+        batches = [
+            (offset, transactions[offset : offset + batch_size])
+            for offset in range(0, len(transactions), batch_size)
+        ]
+        if not batches:
+            return []
+
+        total_batches = len(batches)
+        completed = 0
+        semaphore = asyncio.Semaphore(min(max_concurrency, total_batches))
+
+        async def run_batch(offset, batch):
+            nonlocal completed
+            async with semaphore:
+                batch_results = await self._categorize_one_batch_async(batch, offset)
 
             if progress_callback:
-                progress = 20 + (batch_num / total_batches) * 60
+                completed += 1
+                progress = 20 + (completed / total_batches) * 60
                 progress_callback(
                     int(progress),
-                    f"Processing batch {batch_num}/{total_batches} ({len(batch)} transactions)",
+                    f"Processed batch {completed}/{total_batches} ({len(batch)} transactions)",
                 )
+            return batch_results
 
-            # Create minimal data for each transaction
-            minimal_data = [
-                {
-                    "id": i + idx,
-                    "text": txn.get("text", ""),
-                    "amount": f"{txn.get('amount', 0)} {'D' if txn.get('amount', 0) < 0 else 'C'}",
-                    "sender": txn.get("sender", ""),
-                    "message": txn.get("message", ""),
-                }
-                for idx, txn in enumerate(batch)
-            ]
-
-            prompt = f"""As a financial transaction analyst, categorize these {len(minimal_data)} bank transactions by analyzing the vendor/company and understanding what each payment represents.
-
-Transaction data: {json.dumps(minimal_data)}
-Note: D=DEBIT/Outgoing, C=CREDIT/Incoming
+        per_batch_results = await asyncio.gather(
+            *(run_batch(offset, batch) for offset, batch in batches)
+        )
+        return [result for batch_results in per_batch_results for result in batch_results]
+
+    @staticmethod
+    def _build_batch_prompt(batch: List[Dict], offset: int) -> str:
+        """Build the categorization prompt for one batch of transactions."""
+        # Create minimal data for each transaction. The inner single-element
+        # loop binds the amount once per row so the direction check reuses it
+        # instead of a second dict lookup.
+        minimal_data = [
+            {
+                "id": offset + idx,
+                "text": txn.get("text", ""),
+                "amount": f"{amount} {'D' if amount < 0 else 'C'}",
+                "sender": txn.get("sender", ""),
+                "message": txn.get("message", ""),
+            }
+            for idx, txn in enumerate(batch)
+            for amount in (txn.get("amount", 0),)
+        ]
+
+        # Only the transaction JSON varies per batch; the rules/schema tail is
+        # cached as one pre-built block
+        return (
+            f"As a financial transaction analyst, categorize these {len(minimal_data)} bank transactions "
+            f"by analyzing the vendor/company and understanding what each payment represents.\n\n"
+            f"Transaction data: {orjson.dumps(minimal_data).decode()}\n"
+            f"{PromptTemplates.get_batch_prompt_suffix()}"
+        )
 
-Categories: {", ".join(PromptTemplates.CATEGORIES)}
+    _BATCH_SYSTEM_MESSAGE = (
+        "You categorize bank transactions quickly and accurately using comprehensive analysis."
+    )
 
-{PromptTemplates.get_batch_processing_rules()}
+    async def _categorize_one_batch_async(
+        self, batch: List[Dict], offset: int
+    ) -> List[FastBatchResult]:
+        """Async twin of _categorize_one_batch; parsing is shared."""
+        # semantic=False: two different batches number-mask to near-identical
+        # prompts, and a cross-batch hit would replay the wrong rows' results
+        result = await self._make_api_call_async(
+            self._build_batch_prompt(batch, offset),
+            self._BATCH_SYSTEM_MESSAGE,
+            semantic=False,
+        )
+        return self._parse_batch_result(batch, offset, result)
 
-Return JSON: {{"results": [{{"transaction_id": 0, "category": "vendor_payment", "confidence": 0.9, "vendor_name": "Stripe", "vendor_confidence": 0.8}}]}}"""
+    def _categorize_one_batch(
+        self, batch: List[Dict], offset: int
+    ) -> List[FastBatchResult]:
+        """Categorize a single batch of transactions via one API call."""
+        # semantic=False for the same cross-batch collision reason as the
+        # async twin; exact-key and Redis tiers still apply
+        result = self._make_api_call(
+            self._build_batch_prompt(batch, offset),
+            self._BATCH_SYSTEM_MESSAGE,
+            semantic=False,
+        )
+        return self._parse_batch_result(batch, offset, result)
 
-            result = self._make_api_call(
-                prompt,
-                "You categorize bank transactions quickly and accurately using comprehensive analysis.",
-            )
-            batch_results = result.get("results", [])
+    def _parse_batch_result(
+        self, batch: List[Dict], offset: int, result: dict
+    ) -> List[FastBatchResult]:
+        """Convert one batch API response into FastBatchResult objects."""
+        # Index response items by transaction_id once; driving the loop off
+        # the input batch guarantees one result per row in order, so a
+        # missing or duplicated id in the response can no longer shift every
+        # later row (the old len(results)-based fallback index drifted)
+        by_id = {}
+        for item in result.get("results", []):
+            transaction_id = item.get("transaction_id")
+            if isinstance(transaction_id, int):
+                by_id.setdefault(transaction_id, item)
+
+        # Convert the batch to columns once at the batch boundary, then
+        # score data quality for all rows in one vectorized pass; both the
+        # category and fallback confidence calls below consume the per-row
+        # score instead of re-deriving it transaction by transaction
+        columns = transactions_to_columns(batch)
+        quality_scores = self.confidence_calc.calculate_transaction_quality_scores(
+            batch, columns=columns
+        )
 
-            # Convert to FastBatchResult objects
-            for item in batch_results:
+        results = []
+        for index, original_transaction in enumerate(batch):
+            item = by_id.get(offset + index)
+            if item is not None:
                 try:
-                    # Get the original transaction for confidence calculation
-                    transaction_index = item.get("transaction_id", i + len(results)) - i
-                    original_transaction = batch[transaction_index] if transaction_index < len(batch) else {}
+                    # Join the searchable text once; both confidence calls need it
+                    text_content = transaction_text(original_transaction)
 
                     # Calculate dynamic confidence values
                     llm_confidence = item.get("confidence")
                     category = item.get("category", "other")
                     calculated_confidence = self.confidence_calc.calculate_category_confidence(
-                        original_transaction, category, llm_confidence
+                        original_transaction, category, llm_confidence,
+                        text_content=text_content, quality_score=quality_scores[index],
                     )
 
                     vendor_name = item.get("vendor_name")
                     llm_vendor_confidence = item.get("vendor_confidence")
                     calculated_vendor_confidence = self.confidence_calc.calculate_vendor_confidence(
-                        vendor_name, original_transaction, llm_vendor_confidence
+                        vendor_name, original_transaction, llm_vendor_confidence, text_content=text_content
                     ) if vendor_name else 0.0
 
                     results.append(
                         FastBatchResult(
-                            transaction_id=item.get("transaction_id", i + len(results)),
+                            transaction_id=offset + index,
                             category=category,
                             confidence=calculated_confidence,
                             vendor_name=vendor_name,
                             vendor_confidence=calculated_vendor_confidence,
                         )
                     )
+                    continue
                 except Exception as e:
-                    print(f"Error processing item: {e}")
-                    # Calculate fallback confidence for error cases
-                    fallback_transaction = batch[len(results)] if len(results) < len(batch) else {}
-                    fallback_confidence = self.confidence_calc.calculate_llm_fallback_confidence(
-                        fallback_transaction, "other"
-                    )
-                    results.append(
-                        FastBatchResult(
-                            transaction_id=i + len(results),
-                            category="other",
-                            confidence=fallback_confidence,
-                        )
-                    )
+                    logger.warning("Error processing item: %s", e)
+
+            # Missing or malformed item: fallback confidence for this row only
+            fallback_confidence = self.confidence_calc.calculate_llm_fallback_confidence(
+                original_transaction, "other", quality_score=quality_scores[index]
+            )
+            results.append(
+                FastBatchResult(
+                    transaction_id=offset + index,
+                    category="other",
+                    confidence=fallback_confidence,
+                )
+            )
 
         return results
 
+    def _probe_domain(
+        self, single_domain: str, company_name: str
+    ) -> Optional[Tuple[float, int, int, int]]:
+        """Issue the HTTP check for one domain and return its raw metrics.
+
+        Returns (response_time, content_matches, total_words, status_code),
+        or None when the host is unreachable. Scoring happens in
+        _verify_domain, which feeds all probed candidates through the
+        vectorized confidence calculation in one pass.
+        """
+        try:
+            test_url = (
+                f"https://{single_domain}"
+                if not single_domain.startswith(("http://", "https://"))
+                else single_domain
+            )
+
+            # DNS pre-check: a non-resolving host (common for guessed TLD
+            # variants) fails in milliseconds here instead of eating the 2s
+            # HTTP connect timeout. The (False, 0.0) result is cached by the
+            # caller like any other probe outcome.
+            host = test_url.split("://", 1)[-1].split("/", 1)[0].split(":", 1)[0]
+            try:
+                socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+            except socket.gaierror:
+                return None
+
+            headers = {"User-Agent": "Mozilla/5.0 (compatible; VendorVerifier/1.0)"}
+
+            # One ranged GET settles the probe. A HEAD pre-check can't be
+            # trusted as a failure signal — bot filters commonly answer HEAD
+            # with 400/403 on pages a GET serves fine — and a successful
+            # HEAD still needs the body for content scoring, so it only
+            # added a round trip. Only the first 32 KB matters (title/meta/
+            # header content is plenty for name matching), so ask for that
+            # range and stream instead of downloading multi-MB pages; the
+            # cap also bounds what a failing domain can cost.
+            start_time = time.time()
+            response = self._http.get(
+                test_url,
+                timeout=2,  # Reduced from 5s to 2s for faster processing
+                allow_redirects=True,
+                stream=True,
+                headers={**headers, "Range": f"bytes=0-{_PROBE_MAX_BYTES - 1}"},
+            )
+            body = response.raw.read(_PROBE_MAX_BYTES, decode_content=True)
+            response.close()
+            response_time = time.time() - start_time
+
+            # A failing GET is the real verdict; skip content scanning on
+            # error pages
+            if response.status_code not in (200, 206):
+                return (response_time, 0, 1, response.status_code)
+
+            # Calculate content matches for dynamic scoring. Tokenizing the
+            # company name is memoized, so candidate domains for the same
+            # vendor (and repeat vendors) share one lower/split pass; only
+            # the C-level substring scans run per response.
+            content = body.decode("utf-8", errors="ignore").lower()
+            scan_words, total_words = _company_name_words(company_name)
+            matches = sum(1 for word in scan_words if word in content)
+
+            # Servers honoring the Range header answer 206; score it as the
+            # 200 it stands in for
+            return (response_time, matches, total_words, 200)
+
+        except Exception as e:
+            logger.debug("Domain verification error for %s: %s", single_domain, e)
+            return None
+
     def _verify_domain(self, domain: str, company_name: str) -> Tuple[bool, float]:
         """Verify if a domain belongs to the company with caching for repeated checks."""
         if not domain:
@@ -456,77 +1238,95 @@ Return JSON: {{"results": [{{"transaction_id": 0, "category": "vendor_payment",
 
         # Handle comma-separated domains by trying each one
         domains_to_try = [d.strip() for d in domain.split(",") if d.strip()]
+        if not domains_to_try:
+            return False, 0.0
 
+        # Resolve what we can from cache, collect the rest for probing
+        results = {}
+        to_probe = []
         for single_domain in domains_to_try:
-            # Check domain cache first for this specific domain
             cache_key = f"{single_domain}||{company_name.lower()}"
-            if cache_key in self._domain_cache:
-                cached_item = self._domain_cache[cache_key]
-                if not self._is_cache_expired(cached_item["timestamp"]):
-                    print(
-                        f"[CACHE HIT] Using cached domain verification for {single_domain}"
-                    )
-                    result = cached_item["data"]
-                    if result[0]:  # If this domain is valid, return it
-                        return result
-                    continue  # Try next domain if this one failed
-                else:
-                    del self._domain_cache[cache_key]
-
-            try:
-                test_url = (
-                    f"https://{single_domain}"
-                    if not single_domain.startswith(("http://", "https://"))
-                    else single_domain
-                )
-                start_time = time.time()
-                response = requests.get(
-                    test_url,
-                    timeout=2,  # Reduced from 5s to 2s for faster processing
-                    allow_redirects=True,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (compatible; VendorVerifier/1.0)"
-                    },
+            cached = self._domain_cache.get(cache_key)
+            if cached is None:
+                raw = self._redis_get(f"domain:{cache_key}")
+                if raw is not None:
+                    cached = (raw[0], raw[1])
+                    self._domain_cache[cache_key] = cached
+            if cached is not None:
+                logger.debug(
+                    "[CACHE HIT] Using cached domain verification for %s",
+                    single_domain,
                 )
-                response_time = time.time() - start_time
-
-                # Calculate content matches for dynamic scoring
-                content = response.text.lower()
-                company_lower = company_name.lower()
-                name_words = company_lower.split()
-                matches = sum(
-                    1 for word in name_words if len(word) > 2 and word in content
+                results[single_domain] = cached
+                continue
+            to_probe.append(single_domain)
+
+        # Probe all uncached candidates in parallel over the pooled session;
+        # a vendor's candidate list now costs the slowest probe, not the sum
+        if to_probe:
+            if len(to_probe) == 1:
+                probed = [self._probe_domain(to_probe[0], company_name)]
+            else:
+                probed = list(
+                    _DOMAIN_EXECUTOR.map(
+                        lambda d: self._probe_domain(d, company_name), to_probe
+                    )
                 )
-                total_words = len(name_words)
 
-                # Use dynamic confidence calculation
-                result = self.confidence_calc.calculate_domain_confidence(
-                    single_domain, company_name, response_time, matches, total_words, response.status_code
+            # The parallel map hands back all probe metrics at once, so score
+            # them in one vectorized pass; unreachable hosts (None) keep the
+            # hard (False, 0.0)
+            scored = {single_domain: (False, 0.0) for single_domain in to_probe}
+            measured = [
+                (single_domain, metrics)
+                for single_domain, metrics in zip(to_probe, probed)
+                if metrics is not None
+            ]
+            if measured:
+                is_valid, confidence = self.confidence_calc.calculate_domain_confidence_batch(
+                    [single_domain for single_domain, _ in measured],
+                    [metrics[0] for _, metrics in measured],
+                    [metrics[1] for _, metrics in measured],
+                    [metrics[2] for _, metrics in measured],
+                    [metrics[3] for _, metrics in measured],
                 )
+                for index, (single_domain, _) in enumerate(measured):
+                    scored[single_domain] = (
+                        bool(is_valid[index]),
+                        float(confidence[index]),
+                    )
 
-            except Exception as e:
-                print(f"Domain verification error for {single_domain}: {e}")
-                result = (False, 0.0)
-
-            # Cache the domain verification result for this specific domain
-            self._domain_cache[cache_key] = {"data": result, "timestamp": time.time()}
-
-            # If this domain is valid, return it immediately
+            company_lower = company_name.lower()
+            known_domains = self._vendor_to_domains.setdefault(company_lower, [])
+            for single_domain in to_probe:
+                result = scored[single_domain]
+                cache_key = f"{single_domain}||{company_lower}"
+                self._domain_cache[cache_key] = result
+                self._redis_set(f"domain:{cache_key}", list(result))
+                if single_domain not in known_domains:
+                    known_domains.append(single_domain)
+                results[single_domain] = result
+
+        # Preserve the original preference order: first valid domain wins
+        last_result = (False, 0.0)
+        for single_domain in domains_to_try:
+            result = results[single_domain]
             if result[0]:
-                print(
-                    f"[DOMAIN VERIFIED] Successfully verified domain: {single_domain}"
+                logger.debug(
+                    "[DOMAIN VERIFIED] Successfully verified domain: %s", single_domain
                 )
                 return result
+            last_result = result
 
-        # If no domains were valid, return the last result (or False, 0.0 if no domains tried)
-        return result if "result" in locals() else (False, 0.0)
+        return last_result
 
     def clear_cache(self):
         """Clear all caches manually if needed."""
         self._vendor_cache.clear()
         self._domain_cache.clear()
         self._prompt_cache.clear()
-        print("All caches cleared")
+        self._vendor_to_domains.clear()
+        logger.debug("All caches cleared")
 
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics for monitoring."""
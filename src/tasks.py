@@ -1,9 +1,152 @@
 # Background tasks for CSV processing
 import os
+import time
 import uuid
+from dataclasses import asdict
+from typing import Dict, List
+
+from celery import group
+from celery.result import allow_join_result
 
 from src.celery_app import celery_app
 from src.compact_processor import CompactTransactionProcessor
+from src.streamlined_categorizer import FastBatchResult, StreamlinedCategorizer
+from src.utils import CSVUtils
+
+# Rows parsed per streamed CSV chunk: bounds peak memory to O(chunk) while
+# staying large enough to keep the group fan-out busy
+_CSV_STREAM_CHUNK_ROWS = 2000
+
+# Only these fields are needed for categorization and confidence scoring;
+# shipping slim dicts keeps broker payloads small. The date crosses the
+# wire as an ISO string (quality scoring counts it toward field
+# completeness, so dropping it would deflate every remote row's score).
+_TRANSPORT_FIELDS = ("text", "message", "sender", "receiver", "amount", "currency", "date")
+
+# How long the group join may go without a single subtask finishing before
+# we assume the pool can't serve it (e.g. this task occupies the only worker
+# slot) and fall back to inline processing instead of waiting forever
+_GROUP_STALL_TIMEOUT_SECONDS = 120
+
+# One categorizer per worker process, keyed by configuration, so repeated
+# subtasks reuse its HTTP pools and caches instead of rebuilding them
+_worker_categorizers: Dict[tuple, StreamlinedCategorizer] = {}
+
+
+def _get_categorizer(
+    api_key: str, model: str, provider: str, verify_domains: bool
+) -> StreamlinedCategorizer:
+    key = (api_key, model, provider, verify_domains)
+    categorizer = _worker_categorizers.get(key)
+    if categorizer is None:
+        categorizer = StreamlinedCategorizer(api_key, verify_domains)
+        categorizer.model = model
+        categorizer.provider = provider
+        _worker_categorizers[key] = categorizer
+    return categorizer
+
+
+@celery_app.task(name="src.tasks.categorize_batch_task")
+def categorize_batch_task(
+    batch: List[Dict],
+    api_key: str,
+    model: str = "gpt-4o-mini",
+    provider: str = "OpenAI",
+    verify_domains: bool = True,
+) -> List[Dict]:
+    """Categorize one batch of slim transaction dicts on any free worker."""
+    categorizer = _get_categorizer(api_key, model, provider, verify_domains)
+    results = categorizer.categorize_batch_ultra_fast(batch, batch_size=len(batch))
+    # Dataclasses don't serialize through the result backend; plain dicts do
+    return [asdict(result) for result in results]
+
+
+def _categorize_rows(
+    processor: CompactTransactionProcessor,
+    rows: List[Dict],
+    api_key: str,
+    model: str,
+    provider: str,
+    verify_domains: bool,
+    batch_size: int,
+    progress_callback,
+) -> List[FastBatchResult]:
+    """Categorize one slice of rows, fanning batches out across workers.
+
+    Multi-batch slices become a Celery group (one subtask per batch) so
+    the whole pool shares the LLM calls; single batches run inline where
+    the dispatch overhead isn't worth it.
+
+    Waiting on subtasks from inside a task is the classic synchronous-join
+    deadlock: with a small pool this task can occupy the slot its own
+    subtasks need. The join therefore watches completed_count() — if no
+    subtask finishes within _GROUP_STALL_TIMEOUT_SECONDS the group is
+    revoked and the whole slice runs inline instead of blocking forever.
+    """
+    slim_rows = [
+        {
+            field: value.isoformat() if hasattr(value, "isoformat") else value
+            for field in _TRANSPORT_FIELDS
+            for value in (txn.get(field),)
+        }
+        for txn in rows
+    ]
+    batches = [
+        slim_rows[offset : offset + batch_size]
+        for offset in range(0, len(rows), batch_size)
+    ]
+
+    if len(batches) > 1:
+        job = group(
+            categorize_batch_task.s(batch, api_key, model, provider, verify_domains)
+            for batch in batches
+        )
+        group_result = job.apply_async()
+
+        total_batches = len(batches)
+        last_completed = 0
+        last_advance = time.monotonic()
+        stalled = False
+        while not group_result.ready():
+            completed = group_result.completed_count()
+            if completed > last_completed:
+                last_completed = completed
+                last_advance = time.monotonic()
+            elif time.monotonic() - last_advance > _GROUP_STALL_TIMEOUT_SECONDS:
+                # No progress for the whole window: assume the pool can't
+                # pick the subtasks up (e.g. this is the only worker slot)
+                # and reclaim the work rather than deadlocking
+                group_result.revoke()
+                stalled = True
+                break
+            progress_callback(
+                20 + int(completed / total_batches * 60),
+                f"Processed batch {completed}/{total_batches} across workers",
+            )
+            time.sleep(1)
+
+        if not stalled:
+            with allow_join_result():
+                per_batch_results = group_result.get()
+
+            # group preserves subtask order; reassign global transaction ids
+            batch_results = []
+            for batch_dicts in per_batch_results:
+                for item in batch_dicts:
+                    batch_results.append(
+                        FastBatchResult(
+                            transaction_id=len(batch_results),
+                            category=item["category"],
+                            confidence=item["confidence"],
+                            vendor_name=item.get("vendor_name"),
+                            vendor_confidence=item.get("vendor_confidence", 0.0),
+                        )
+                    )
+            return batch_results
+
+    return processor.categorizer.categorize_batch_ultra_fast(
+        rows, batch_size=batch_size, progress_callback=progress_callback
+    )
 
 
 @celery_app.task(bind=True, name="src.tasks.process_csv_async")
@@ -34,83 +177,89 @@ def process_csv_async(
         # Generate unique batch ID for this processing run
         batch_id = str(uuid.uuid4())
 
-        # Initialize processor
+        # Initialize processor (the constructor already propagates
+        # verify_domains to the categorizer; no redundant attribute write)
         processor = CompactTransactionProcessor(api_key, verify_domains)
         processor.categorizer.model = model
         processor.categorizer.provider = provider
-        processor.categorizer.verify_domains = verify_domains
 
-        # Read CSV using shared utility
-        all_transactions = processor.read_csv_file(csv_path)
-        total_transactions = len(all_transactions)
+        # Stream the CSV in bounded chunks instead of materializing every
+        # row up front: peak memory stays O(chunk), and AI calls for the
+        # first chunk start while the rest of the file is still unparsed.
+        # The grand total isn't known until the last chunk, so progress
+        # reports rows processed so far.
+        vendor_cache = {}
+        total_processed = 0
+        vendor_payments = 0
+        total_amount = 0.0
+        confidence_sum = 0.0
 
-        # Update progress
-        print(f"[PROGRESS] CSV loaded - Found {total_transactions} transactions")
-        self.update_state(
-            state="PROGRESS",
-            meta={
-                "current": 0,
-                "total": total_transactions,
-                "status": f"Processing {total_transactions} transactions...",
-                "stage": "processing",
-            },
-        )
+        for chunk in CSVUtils.iter_transaction_chunks(
+            csv_path, chunk_size=_CSV_STREAM_CHUNK_ROWS
+        ):
+            chunk_start = total_processed
+            print(
+                f"[PROGRESS] Categorizing rows {chunk_start + 1}-{chunk_start + len(chunk)}..."
+            )
 
-        # Process transactions in batches with progress updates
-        results = []
-        vendor_cache = {}
+            def progress_callback(percent, status, _start=chunk_start, _size=len(chunk)):
+                print(f"[PROGRESS] {percent}% - {status}")
+                self.update_state(
+                    state="PROGRESS",
+                    meta={
+                        "current": _start + int(_size * percent / 100),
+                        "total": _start + _size,
+                        "status": status,
+                        "stage": "ai_processing",
+                    },
+                )
 
-        # AI Processing phase
-        print(
-            f"[PROGRESS] Starting AI categorization for {total_transactions} transactions..."
-        )
-        self.update_state(
-            state="PROGRESS",
-            meta={
-                "current": 0,
-                "total": total_transactions,
-                "status": "Starting AI categorization...",
-                "stage": "ai_processing",
-            },
-        )
+            batch_results = _categorize_rows(
+                processor,
+                chunk,
+                api_key,
+                model,
+                provider,
+                verify_domains,
+                batch_size,
+                progress_callback,
+            )
 
-        # Create a progress callback for the AI processing
-        def progress_callback(percent, status):
-            print(f"[PROGRESS] {percent}% - {status}")
-            self.update_state(
-                state="PROGRESS",
-                meta={
-                    "current": int(total_transactions * percent / 100),
-                    "total": total_transactions,
-                    "status": status,
-                    "stage": "ai_processing",
-                },
+            # Save this chunk before parsing the next; only summary
+            # accumulators outlive the loop iteration
+            chunk_results = processor.process_transactions_batch(
+                chunk,
+                batch_results,
+                vendor_cache,
+                progress_callback=lambda current, total, status: self.update_state(
+                    state="PROGRESS",
+                    meta={
+                        "current": chunk_start + current,
+                        "total": chunk_start + total,
+                        "status": status,
+                        "stage": "database_save",
+                    },
+                ),
+                batch_id=batch_id,
             )
 
-        batch_results = processor.categorizer.categorize_batch_ultra_fast(
-            all_transactions, batch_size=batch_size, progress_callback=progress_callback
-        )
+            # process_transactions_batch only adds rows to the session;
+            # commit here so each chunk is flushed to disk and its pending
+            # ORM objects released before the next chunk is parsed — without
+            # this the session accumulated every chunk and close() rolled
+            # the whole run back
+            processor.db_session.commit()
 
-        # Database saving phase - use optimized processor method
-        results = processor.process_transactions_batch(
-            all_transactions,
-            batch_results,
-            vendor_cache,
-            progress_callback=lambda current, total, status: self.update_state(
-                state="PROGRESS",
-                meta={
-                    "current": current,
-                    "total": total,
-                    "status": status,
-                    "stage": "database_save",
-                },
-            ),
-            batch_id=batch_id,
-        )
+            total_processed += len(chunk_results)
+            for result in chunk_results:
+                if result.category == "vendor_payment":
+                    vendor_payments += 1
+                total_amount += abs(result.amount)
+                confidence_sum += result.category_confidence
 
-        # Database commit is handled by the processor
+        # Every chunk is already committed; close just releases the session
         print(
-            f"[PROGRESS] ✅ Processing completed! {len(results)} transactions processed successfully"
+            f"[PROGRESS] ✅ Processing completed! {total_processed} transactions processed successfully"
         )
         processor.close()
 
@@ -123,16 +272,13 @@ def process_csv_async(
 
         return {
             "status": "completed",
-            "total_processed": len(results),
+            "total_processed": total_processed,
             "vendors_found": len(vendor_cache),
             "results_summary": {
-                "vendor_payments": len(
-                    [r for r in results if r["category"] == "vendor_payment"]
-                ),
-                "total_amount": sum([abs(r["amount"]) for r in results]),
-                "avg_confidence": sum([r["category_confidence"] for r in results])
-                / len(results)
-                if results
+                "vendor_payments": vendor_payments,
+                "total_amount": total_amount,
+                "avg_confidence": confidence_sum / total_processed
+                if total_processed
                 else 0,
             },
         }
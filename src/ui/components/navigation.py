@@ -9,12 +9,10 @@ class AppState:
     """Centralized application state management."""
 
     def __init__(self):
-        if "app_state_initialized" not in st.session_state:
-            self._initialize_state()
+        self._initialize_state()
 
     def _initialize_state(self):
         """Initialize default session state."""
-        st.session_state.app_state_initialized = True
         st.session_state.current_page = "Process Transactions"
         st.session_state.background_tasks = []
         st.session_state.processing_progress = {"active": False}
@@ -60,11 +58,28 @@ class AppState:
         ]
 
 
+def get_app_state() -> AppState:
+    """Return this session's AppState, creating it on first use.
+
+    Construction (and the session-state initialization it performs) runs
+    once per session instead of once per rerun at every call site.
+    """
+    ss = st.session_state
+    if "app_state" not in ss:
+        ss["app_state"] = AppState()
+    return ss["app_state"]
+
+
 def create_navigation() -> str:
     """Create navigation with buttons and sliding border effect."""
+    # Bind session state once; every attribute access on st.session_state
+    # goes through the runtime's context lookup, so repeated dotted reads
+    # add up across reruns
+    ss = st.session_state
+
     # Initialize active page if not set
-    if "active_page" not in st.session_state:
-        st.session_state.active_page = "Process Transactions"
+    if "active_page" not in ss:
+        ss.active_page = "Process Transactions"
 
     # Navigation container with custom div
     st.markdown('<div class="nav-container">', unsafe_allow_html=True)
@@ -74,23 +89,23 @@ def create_navigation() -> str:
 
     with col1:
         if st.button("Process Transactions", key="nav_process"):
-            st.session_state.active_page = "Process Transactions"
+            ss.active_page = "Process Transactions"
 
     with col2:
         if st.button("Analytics", key="nav_analytics"):
-            st.session_state.active_page = "Analytics"
+            ss.active_page = "Analytics"
 
     with col3:
         if st.button("Vendor Payments", key="nav_vendor_payments"):
-            st.session_state.active_page = "Vendor Payments"
+            ss.active_page = "Vendor Payments"
 
     with col4:
         if st.button("Vendors", key="nav_vendors"):
-            st.session_state.active_page = "Vendors"
+            ss.active_page = "Vendors"
 
     with col5:
         if st.button("Database", key="nav_database"):
-            st.session_state.active_page = "Database"
+            ss.active_page = "Database"
 
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -101,62 +116,84 @@ def create_navigation() -> str:
         "Vendor Payments": 2,
         "Vendors": 3,
         "Database": 4,
-    }.get(st.session_state.active_page, 0)
+    }.get(ss.active_page, 0)
 
     st.markdown(
         f"""
     <script>
+    // Written outside the init guard so every injection refreshes it: the
+    // listeners below survive across pages, but the active page does not
+    window.__navActiveIndex = {active_index};
+
     function initSlidingBorder() {{
-        setTimeout(() => {{
-            const navContainer = document.querySelector('.nav-container');
-            if (!navContainer || navContainer.querySelector('.sliding-border')) return;
+        // Guard against repeated injection: Streamlit re-emits this block
+        // on every rerun, but one initialization per page load is enough
+        if (window.__navInit) return;
 
+        const navContainer = document.querySelector('.nav-container');
+        if (!navContainer) return;
+        window.__navInit = true;
+
+        if (!navContainer.querySelector('.sliding-border')) {{
             const slidingBorder = document.createElement('div');
             slidingBorder.className = 'sliding-border';
             navContainer.appendChild(slidingBorder);
-
-            const buttons = navContainer.querySelectorAll('.stButton button');
-            const activeIndex = {active_index};
-
-            // Set initial position for active page
-            function setActivePosition() {{
-                slidingBorder.style.transform = `translateX(${{activeIndex * 100}}%)`;
+        }}
+        const slidingBorder = navContainer.querySelector('.sliding-border');
+
+        const buttons = navContainer.querySelectorAll('.stButton button');
+
+        // Position the border over the current page; reading the index from
+        // window each time keeps this correct after navigation, when the
+        // guard has skipped re-initialization but the index was refreshed
+        function setActivePosition() {{
+            slidingBorder.style.transform = `translateX(${{window.__navActiveIndex * 100}}%)`;
+            slidingBorder.style.opacity = '1';
+            slidingBorder.style.visibility = 'visible';
+        }}
+
+        // Initialize position immediately
+        setActivePosition();
+
+        buttons.forEach((button, index) => {{
+            button.addEventListener('mouseenter', () => {{
+                slidingBorder.style.transform = `translateX(${{index * 100}}%)`;
                 slidingBorder.style.opacity = '1';
                 slidingBorder.style.visibility = 'visible';
-            }}
-
-            // Initialize position immediately
-            setActivePosition();
-
-            buttons.forEach((button, index) => {{
-                button.addEventListener('mouseenter', () => {{
-                    slidingBorder.style.transform = `translateX(${{index * 100}}%)`;
-                    slidingBorder.style.opacity = '1';
-                    slidingBorder.style.visibility = 'visible';
-                }});
-            }});
-
-            navContainer.addEventListener('mouseleave', () => {{
-                setActivePosition();
             }});
+        }});
 
-            // Force update every 500ms to ensure border stays visible
-            setInterval(setActivePosition, 500);
-        }}, 100);
+        navContainer.addEventListener('mouseleave', () => {{
+            setActivePosition();
+        }});
+
+        // Re-assert the border only when Streamlit actually rewrites the
+        // container, instead of polling on a timer that wakes the main
+        // thread every 500ms forever
+        const observer = new MutationObserver(() => {{
+            if (!navContainer.contains(slidingBorder)) {{
+                navContainer.appendChild(slidingBorder);
+            }}
+            setActivePosition();
+        }});
+        observer.observe(navContainer, {{ childList: true, subtree: true }});
+    }}
+    // The nav container may not exist yet while the document is still
+    // parsing; wait for DOMContentLoaded only in that case
+    if (document.readyState === 'loading') {{
+        document.addEventListener('DOMContentLoaded', initSlidingBorder);
+    }} else {{
+        initSlidingBorder();
     }}
-    initSlidingBorder();
-    // Re-run when page changes
-    setTimeout(initSlidingBorder, 200);
-    setTimeout(initSlidingBorder, 500);
     </script>
     """,
         unsafe_allow_html=True,
     )
 
-    selected_page = st.session_state.active_page
+    selected_page = ss.active_page
 
     # Show active background tasks in sidebar
-    app_state = AppState()
+    app_state = get_app_state()
     active_tasks = app_state.get_active_tasks()
 
     if active_tasks:
@@ -3,16 +3,90 @@
 Provides database management interface with stats, deletion, reset, and export functionality.
 """
 
+import io
+import math
 import time
 from typing import Dict, List, Any
 
 import pandas as pd
 import streamlit as st
 
-from src.models import Transaction
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload
+
+from src.models import Transaction, Vendor, get_db_session
 from src.ui.components.navigation import show_page_header
 
 
+def _db_version() -> int:
+    """Version token for query caches; bumped whenever the page mutates data."""
+    return st.session_state.setdefault("db_version", 0)
+
+
+def _bump_db_version():
+    """Invalidate version-keyed query caches after a delete or reset."""
+    st.session_state["db_version"] = _db_version() + 1
+
+
+@st.cache_data(ttl=120, show_spinner=False)
+def _category_agg(_session_factory, version: int) -> List[tuple]:
+    """Run the per-category count/sum aggregate once per TTL or version bump.
+
+    Returns plain tuples — SQLAlchemy row objects don't pickle into the
+    cache. The version argument only exists to key the cache.
+    """
+    session = _session_factory()
+    try:
+        rows = (
+            session.query(
+                Transaction.category,
+                func.count(Transaction.id).label("count"),
+                func.sum(func.abs(Transaction.amount)).label("total_amount"),
+            )
+            .group_by(Transaction.category)
+            .all()
+        )
+        return [tuple(row) for row in rows]
+    finally:
+        session.close()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_transactions_csv(_page, version: int):
+    """Memoize the transactions export so plain reruns skip the table scan.
+
+    Keyed on the db_version token like the other query caches; a delete or
+    reset bumps the version and the next render regenerates the bytes.
+    """
+    return _page._generate_transactions_csv()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_vendors_csv(_page, version: int):
+    """Memoize the vendors export alongside the transactions one."""
+    return _page._generate_vendors_csv()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_vendors(_processor, version: int) -> List[Dict]:
+    """Fetch the vendor list once per rerun burst.
+
+    The delete picker and the vendors export both need it; without the
+    cache each page render hit the database twice for the same rows.
+    """
+    return _processor.get_all_vendors()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_db_stats(_processor) -> Dict:
+    """Fetch database statistics once per TTL window instead of per rerun.
+
+    The leading underscore keeps Streamlit from trying to hash the
+    processor; deletes and resets clear this cache explicitly.
+    """
+    return _processor.get_database_stats()
+
+
 class DatabasePage:
     """Database management page with stats and operations."""
 
@@ -41,7 +115,7 @@ class DatabasePage:
 
     def _render_database_stats(self):
         """Render database statistics section."""
-        stats = self.processor.get_database_stats()
+        stats = _cached_db_stats(self.processor)
 
         col1, col2, col3 = st.columns(3)
 
@@ -92,35 +166,32 @@ class DatabasePage:
         else:
             st.metric("Date Range", "No data")
 
+    @st.fragment
     def _render_transaction_categories(self):
-        """Render transaction categories breakdown."""
+        """Render transaction categories breakdown.
+
+        Runs as a fragment: changing the category filter or page selector
+        reruns only this section instead of the whole Database page.
+        """
         st.markdown("### Transaction Categories")
 
         try:
-            from src.models import Transaction, get_db_session
-            from sqlalchemy import func
-            import pandas as pd
-
             session = get_db_session()
 
-            # Get category distribution
-            categories = session.query(
-                Transaction.category,
-                func.count(Transaction.id).label('count'),
-                func.sum(func.abs(Transaction.amount)).label('total_amount')
-            ).group_by(Transaction.category).all()
+            # Category distribution comes from the version-keyed cache, so
+            # toggling the multiselect below doesn't re-run the aggregate
+            categories = _category_agg(get_db_session, _db_version())
 
             if categories:
-                # Create DataFrame for better display
-                category_data = []
-                for cat, count, amount in categories:
-                    category_data.append({
-                        'Category': cat or 'Unknown',
-                        'Count': count,
-                        'Total Amount': f"{amount:,.2f} DKK" if amount else "0 DKK"
-                    })
-
-                df = pd.DataFrame(category_data)
+                # Build the display frame straight from the aggregate tuples
+                # and format column-wise — no per-row dict building
+                df = pd.DataFrame(
+                    categories, columns=['Category', 'Count', 'Total Amount']
+                )
+                df['Category'] = df['Category'].fillna('Unknown')
+                df['Total Amount'] = df['Total Amount'].map(
+                    lambda a: f"{a:,.2f} DKK" if pd.notna(a) and a else "0 DKK"
+                )
                 df = df.sort_values('Count', ascending=False)
 
                 # Display summary metrics
@@ -155,33 +226,74 @@ class DatabasePage:
                         default=['All']
                     )
 
-                    # Build filter condition
+                    # Build filter condition; the row count comes from the
+                    # cached aggregate instead of a COUNT query
                     if 'All' in selected_categories or not selected_categories:
                         category_filter = Transaction.category != 'vendor_payment'
+                        total_rows = sum(
+                            count for cat, count, _ in categories
+                            if cat != 'vendor_payment'
+                        )
                     else:
                         category_filter = Transaction.category.in_(selected_categories)
+                        total_rows = sum(
+                            count for cat, count, _ in categories
+                            if cat in selected_categories
+                        )
 
-                    # Get all non-vendor transactions with optional filtering
-                    non_vendor_transactions = session.query(Transaction).filter(
-                        category_filter
-                    ).order_by(Transaction.date.desc()).all()
-
-                    if non_vendor_transactions:
-                        all_data = []
-                        for t in non_vendor_transactions:
-                            all_data.append({
-                                'Date': t.date.strftime('%Y-%m-%d') if t.date else 'N/A',
-                                'Amount': f"{t.amount:,.2f} DKK",
-                                'Category': t.category or 'Unknown',
-                                'Confidence': f"{t.category_confidence:.2f}" if t.category_confidence else 'N/A',
-                                'Description': t.text,
-                                'Vendor': getattr(t.vendor, 'name', 'N/A') if t.vendor else 'N/A'
-                            })
-
-                        all_df = pd.DataFrame(all_data)
+                    # Server-side pagination: the database returns one page
+                    # and the browser renders one page, whatever the table
+                    # size
+                    page_size = 200
+                    total_pages = max(1, math.ceil(total_rows / page_size))
+                    page = st.number_input(
+                        "Page", min_value=1, max_value=total_pages, value=1
+                    )
+
+                    # Rows here are display-only, so skip ORM hydration
+                    # entirely: a Core select with the vendor outer-joined
+                    # goes straight into a DataFrame
+                    stmt = (
+                        select(
+                            Transaction.date,
+                            Transaction.amount,
+                            Transaction.category,
+                            Transaction.category_confidence,
+                            Transaction.text,
+                            Vendor.name.label('vendor'),
+                        )
+                        .select_from(
+                            Transaction.__table__.outerjoin(Vendor.__table__)
+                        )
+                        .where(category_filter)
+                        .order_by(Transaction.date.desc())
+                        .offset((page - 1) * page_size)
+                        .limit(page_size)
+                    )
+                    raw = pd.read_sql_query(stmt, session.bind, parse_dates=['date'])
+
+                    if not raw.empty:
+                        # Whole-column formatting: dt.strftime runs in one
+                        # vectorized pass and the map calls avoid building a
+                        # Python frame per row
+                        all_df = pd.DataFrame({
+                            'Date': raw['date'].dt.strftime('%Y-%m-%d').fillna('N/A'),
+                            'Amount': raw['amount'].map('{:,.2f} DKK'.format),
+                            'Category': raw['category'].fillna('Unknown'),
+                            'Confidence': raw['category_confidence'].map(
+                                lambda c: f"{c:.2f}" if pd.notna(c) and c else 'N/A'
+                            ),
+                            'Description': raw['text'],
+                            'Vendor': raw['vendor'].fillna('N/A'),
+                        })
 
                         # Show count info
-                        st.info(f"Showing {len(all_df)} non-vendor transactions")
+                        first_row = (page - 1) * page_size + 1
+                        st.info(
+                            f"Showing rows {first_row}-{first_row + len(all_df) - 1} "
+                            f"of {total_rows} non-vendor transactions"
+                        )
+                        st.caption(f"Page {page} of {total_pages}")
 
                         # Display the full table
                         st.dataframe(
@@ -245,39 +357,36 @@ class DatabasePage:
         with col2:
             self._render_delete_vendors_section()
 
+    @st.fragment
     def _render_delete_transactions_section(self):
-        """Render delete transactions section."""
+        """Render delete transactions section.
+
+        A fragment, so picking transactions doesn't rerun the rest of the
+        page; the delete handler's st.rerun() still reruns the whole app.
+        """
         st.markdown("##### Delete Transactions")
 
         # Get transactions for selection
         transactions = (
             self.processor.db_session.query(Transaction)
+            .options(joinedload(Transaction.vendor))
             .order_by(Transaction.date.desc())
             .limit(100)
             .all()
         )
 
         if transactions:
-            # Create selection interface
-            trans_data = []
-            for t in transactions:
-                trans_data.append(
-                    {
-                        "ID": t.id,
-                        "Date": t.date.strftime("%Y-%m-%d") if t.date else "",
-                        "Amount": f"{t.amount:.2f}",
-                        "Text": t.text[:50] + "..." if len(t.text) > 50 else t.text,
-                        "Category": t.category,
-                    }
-                )
-
-            trans_df = pd.DataFrame(trans_data)
+            # One id->label dict built up front; a per-option lambda that
+            # boolean-filtered a DataFrame made each dropdown render O(N^2)
+            tx_labels = {
+                t.id: f"ID {t.id}: {t.text[:30]}..." for t in transactions
+            }
 
             # Multi-select for transactions
             selected_trans_ids = st.multiselect(
                 "Select transactions to delete:",
-                options=trans_df["ID"].tolist(),
-                format_func=lambda x: f"ID {x}: {trans_df[trans_df['ID'] == x]['Text'].values[0][:30]}...",
+                options=list(tx_labels),
+                format_func=tx_labels.get,
             )
 
             if selected_trans_ids:
@@ -292,32 +401,25 @@ class DatabasePage:
         else:
             st.info("No transactions found")
 
+    @st.fragment
     def _render_delete_vendors_section(self):
-        """Render delete vendors section."""
+        """Render delete vendors section.
+
+        Fragment-scoped for the same reason as the transactions picker.
+        """
         st.markdown("##### Delete Vendors")
 
         # Get vendors for selection
-        vendors = self.processor.get_all_vendors()
+        vendors = _cached_vendors(self.processor, _db_version())
 
         if vendors:
-            vendor_data = []
-            for v in vendors:
-                vendor_data.append(
-                    {
-                        "ID": v["id"],
-                        "Name": v["name"],
-                        "Domain": v["domain"] or "N/A",
-                        "Country": v["country"] or "N/A",
-                    }
-                )
-
-            vendor_df = pd.DataFrame(vendor_data)
+            vendor_labels = {v["id"]: v["name"] for v in vendors}
 
             # Multi-select for vendors
             selected_vendor_ids = st.multiselect(
                 "Select vendors to delete:",
-                options=vendor_df["ID"].tolist(),
-                format_func=lambda x: vendor_df[vendor_df["ID"] == x]["Name"].values[0],
+                options=list(vendor_labels),
+                format_func=vendor_labels.get,
             )
 
             if selected_vendor_ids:
@@ -370,8 +472,9 @@ class DatabasePage:
 
         with col1:
             st.markdown("##### Export Transactions")
-            # Generate CSV data
-            transactions_csv = self._generate_transactions_csv()
+            # Cached generation: widget clicks elsewhere on the page no
+            # longer re-run the full export query
+            transactions_csv = _cached_transactions_csv(self, _db_version())
             if transactions_csv:
                 st.download_button(
                     label="Download Transactions CSV",
@@ -385,8 +488,7 @@ class DatabasePage:
 
         with col2:
             st.markdown("##### Export Vendors")
-            # Generate CSV data
-            vendors_csv = self._generate_vendors_csv()
+            vendors_csv = _cached_vendors_csv(self, _db_version())
             if vendors_csv:
                 st.download_button(
                     label="Download Vendors CSV",
@@ -403,6 +505,8 @@ class DatabasePage:
         success, message = self.processor.delete_transactions(transaction_ids)
         if success:
             st.success(message)
+            _cached_db_stats.clear()
+            _bump_db_version()
             time.sleep(1)
             st.rerun()
         else:
@@ -413,6 +517,8 @@ class DatabasePage:
         success, message = self.processor.delete_vendors(vendor_ids)
         if success:
             st.success(message)
+            _cached_db_stats.clear()
+            _bump_db_version()
             time.sleep(1)
             st.rerun()
         else:
@@ -422,6 +528,8 @@ class DatabasePage:
         """Handle complete database reset."""
         try:
             self.processor.reset_database()
+            _cached_db_stats.clear()
+            _bump_db_version()
             st.success("Database reset successfully!")
             st.balloons()
             time.sleep(2)
@@ -432,37 +540,56 @@ class DatabasePage:
     def _generate_transactions_csv(self):
         """Generate CSV data for transactions export."""
         try:
-            # Get all transactions data with vendor relationship
-            transactions = self.processor.db_session.query(Transaction).all()
+            # One joined statement materialized straight into pandas: no ORM
+            # instances, no per-row dict building, and the vendor name comes
+            # from the outer join instead of a lazy-load per transaction
+            stmt = select(
+                Transaction.id,
+                Transaction.date,
+                Transaction.posting_date,
+                Transaction.amount,
+                Transaction.currency,
+                Transaction.text,
+                Transaction.message,
+                Transaction.transaction_type,
+                Transaction.sender,
+                Transaction.receiver,
+                Transaction.category,
+                Transaction.category_confidence,
+                Transaction.vendor_id,
+                Vendor.name.label("vendor_name"),
+                Transaction.vendor_confidence,
+                Transaction.balance,
+                Transaction.created_at,
+            ).join(Vendor, isouter=True)
+
+            # Stream the result set in bounded chunks rather than holding
+            # the whole table as one DataFrame: peak memory stays O(chunk)
+            # and each page is serialized as soon as it arrives
+            buf = io.StringIO()
+            first = True
+            for chunk in pd.read_sql_query(
+                stmt,
+                self.processor.db_session.bind,
+                parse_dates=["date", "posting_date", "created_at"],
+                chunksize=50_000,
+            ):
+                if chunk.empty:
+                    # pandas can yield one empty frame for a no-row result
+                    continue
+                # Vectorized date formatting over whole columns; NaT formats
+                # to an empty cell, matching the old per-row None handling
+                chunk["date"] = chunk["date"].dt.strftime("%Y-%m-%d")
+                chunk["posting_date"] = chunk["posting_date"].dt.strftime("%Y-%m-%d")
+                chunk["created_at"] = chunk["created_at"].dt.strftime(
+                    "%Y-%m-%d %H:%M:%S"
+                )
+                chunk.to_csv(buf, index=False, header=first)
+                first = False
 
-            if not transactions:
+            if first:
                 return None
-
-            # Convert to DataFrame
-            trans_data = []
-            for t in transactions:
-                trans_data.append({
-                    'id': t.id,
-                    'date': t.date.strftime("%Y-%m-%d") if t.date else None,
-                    'posting_date': t.posting_date.strftime("%Y-%m-%d") if t.posting_date else None,
-                    'amount': t.amount,
-                    'currency': t.currency,
-                    'text': t.text,
-                    'message': t.message,
-                    'transaction_type': t.transaction_type,
-                    'sender': t.sender,
-                    'receiver': t.receiver,
-                    'category': t.category,
-                    'category_confidence': t.category_confidence,
-                    'vendor_id': t.vendor_id,
-                    'vendor_name': t.vendor.name if t.vendor else None,
-                    'vendor_confidence': t.vendor_confidence,
-                    'balance': t.balance,
-                    'created_at': t.created_at.strftime("%Y-%m-%d %H:%M:%S") if t.created_at else None,
-                })
-
-            df = pd.DataFrame(trans_data)
-            return df.to_csv(index=False)
+            return buf.getvalue()
 
         except Exception as e:
             st.error(f"Error preparing transactions export: {str(e)}")
@@ -471,8 +598,8 @@ class DatabasePage:
     def _generate_vendors_csv(self):
         """Generate CSV data for vendors export."""
         try:
-            # Get all vendors data
-            vendors = self.processor.get_all_vendors()
+            # Get all vendors data (shared with the delete picker via cache)
+            vendors = _cached_vendors(self.processor, _db_version())
 
             if not vendors:
                 return None
@@ -12,14 +12,14 @@ import streamlit as st
 
 from src.compact_processor import CompactTransactionProcessor
 from src.tasks import get_task_status, process_csv_async
-from src.ui.components.navigation import AppState, show_page_header
+from src.ui.components.navigation import get_app_state, show_page_header
 
 
 class ProcessTransactionsPage:
     """Process Transactions page handler with background processing support."""
 
     def __init__(self):
-        self.app_state = AppState()
+        self.app_state = get_app_state()
 
     def render(self):
         """Render the Process Transactions page."""
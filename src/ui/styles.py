@@ -4,10 +4,12 @@ This module consolidates all styling from the original 689-line CSS block
 into a clean, maintainable structure with no duplication.
 """
 
+from functools import cache
+
 import streamlit as st
 
 
-@st.cache_data
+@cache
 def get_app_styles() -> str:
     """Get consolidated application styles with dark monochrome theme."""
     return """
@@ -1,11 +1,12 @@
 # Shared utility functions to eliminate code duplication
 from datetime import datetime, timedelta
-from difflib import SequenceMatcher
 from typing import Dict, List, Tuple
 
 import pandas as pd
+from rapidfuzz import fuzz, process
 
 from src.models import Transaction, Vendor, get_db_session
+from src.vendor_matcher import clear_vendor_lookup_cache
 
 
 class CSVUtils:
@@ -68,20 +69,112 @@ class CSVUtils:
             return 0.0
 
     @staticmethod
-    def read_csv_with_encoding_detection(csv_path: str) -> pd.DataFrame:
-        """Read CSV file with automatic encoding detection for Danish characters."""
+    def detect_csv_encoding(csv_path: str) -> str:
+        """Detect file encoding from a 64 KB sniff of the file head."""
         encodings = ["utf-8", "iso-8859-1", "cp1252", "latin-1"]
 
+        with open(csv_path, "rb") as file_handle:
+            head = file_handle.read(64 * 1024)
+        if len(head) == 64 * 1024:
+            head = head[:-4]  # Avoid a multibyte char split at the chunk boundary
+
         for encoding in encodings:
             try:
-                df = pd.read_csv(csv_path, sep=";", encoding=encoding)
-                print(f"✓ Read CSV with {encoding} encoding")
-                return df
+                head.decode(encoding)
+                return encoding
             except UnicodeDecodeError:
                 continue
 
         raise ValueError("Could not read CSV file with any supported encoding")
 
+    @staticmethod
+    def read_csv_with_encoding_detection(csv_path: str) -> pd.DataFrame:
+        """Read CSV file with automatic encoding detection for Danish characters."""
+        encoding = CSVUtils.detect_csv_encoding(csv_path)
+
+        try:
+            # pyarrow: multi-threaded parser, much faster on large files
+            df = pd.read_csv(csv_path, sep=";", encoding=encoding, engine="pyarrow")
+        except Exception:
+            # Fall back for ragged rows the arrow parser rejects
+            df = pd.read_csv(csv_path, sep=";", encoding=encoding)
+        print(f"✓ Read CSV with {encoding} encoding")
+        return df
+
+    @staticmethod
+    def iter_transaction_chunks(csv_path: str, chunk_size: int = 10_000):
+        """Yield transaction-dict batches without materializing the whole CSV.
+
+        Streams the file through pandas' chunked reader and runs each chunk
+        through the vectorized create_transactions_frame, so memory stays
+        bounded by chunk_size regardless of file length.
+        """
+        encoding = CSVUtils.detect_csv_encoding(csv_path)
+        for chunk_df in pd.read_csv(
+            csv_path, sep=";", encoding=encoding, chunksize=chunk_size
+        ):
+            yield CSVUtils.create_transactions_frame(chunk_df)
+
+    @staticmethod
+    def create_transactions_frame(df: pd.DataFrame) -> List[Dict]:
+        """Extract transaction data for a whole DataFrame using vectorized transforms.
+
+        Column-level equivalent of create_transaction_data: dates are parsed with
+        pd.to_datetime, amounts with a vectorized Danish-format conversion, and
+        the result is materialized once via to_dict('records'). Avoids the
+        per-row Series construction cost of df.iterrows() on large CSVs.
+        """
+        if df.empty:
+            return []
+
+        def text_column(name: str) -> pd.Series:
+            if name in df.columns:
+                # fillna first so missing values become "nan" like str() on a row value
+                return df[name].fillna("nan").astype(str)
+            return pd.Series("", index=df.index)
+
+        def amount_column(name: str) -> pd.Series:
+            if name not in df.columns:
+                return pd.Series(0.0, index=df.index)
+            # Same transform as parse_amount: strip thousands dots, comma -> decimal point
+            cleaned = (
+                df[name]
+                .astype(str)
+                .str.strip()
+                .str.replace(".", "", regex=False)
+                .str.replace(",", ".", regex=False)
+            )
+            return pd.to_numeric(cleaned, errors="coerce").fillna(0.0)
+
+        now = datetime.now()
+        dates = pd.to_datetime(text_column("Date"), errors="coerce").fillna(now)
+        posting_dates = pd.to_datetime(
+            text_column("Date of posting") + " " + text_column("Time of posting"),
+            errors="coerce",
+        ).fillna(now)
+
+        parsed = pd.DataFrame(
+            {
+                "date": dates,
+                "posting_date": posting_dates,
+                "text": text_column("Text"),
+                "message": text_column("Message"),
+                "transaction_type": text_column("Transaction type"),
+                "card_info": text_column("Card info"),
+                "amount": amount_column("Amount"),
+                "currency": text_column("Currency"),
+                "sender": text_column("Sender"),
+                "receiver": text_column("Receiver"),
+                "note": text_column("Note"),
+                "balance": amount_column("Balance"),
+            }
+        )
+
+        records = parsed.to_dict("records")
+        for record, raw_row in zip(records, df.to_dict("records")):
+            record["raw_line"] = str(raw_row)
+        return records
+
     @staticmethod
     def create_transaction_data(row) -> Dict:
         """Extract and parse transaction data from CSV row."""
@@ -122,37 +215,72 @@ class DuplicateDetector:
         existing_transactions = (
             db_session.query(Transaction).filter(Transaction.date >= cutoff_date).all()
         )
+        if not existing_transactions or not new_transactions:
+            return duplicates
+
+        # Block existing rows by (calendar day, amount in cents) so each new
+        # transaction only compares against a handful of candidates instead of
+        # the full lookback window
+        blocks = {}
+        for idx, existing in enumerate(existing_transactions):
+            if existing.date is None or existing.amount is None:
+                continue
+            block_key = (existing.date.date(), round(existing.amount * 100))
+            blocks.setdefault(block_key, []).append(idx)
 
         for new_trans in new_transactions:
-            for existing in existing_transactions:
-                # Check date proximity (within 1 day)
-                date_diff = (
-                    abs((new_trans["date"] - existing.date).days)
-                    if existing.date
-                    else 999
-                )
+            new_day = new_trans["date"].date()
+            new_cents = round(new_trans["amount"] * 100)
+
+            # Gather candidates from neighbouring day/amount blocks (superset
+            # of the exact criteria, which are re-checked below)
+            candidate_ids = []
+            for day_offset in range(-2, 3):
+                day = new_day + timedelta(days=day_offset)
+                for cents in (new_cents - 1, new_cents, new_cents + 1):
+                    candidate_ids.extend(blocks.get((day, cents), ()))
+
+            # Check date proximity (within 1 day) and amount match (exact)
+            candidates = []
+            for idx in candidate_ids:
+                existing = existing_transactions[idx]
+                date_diff = abs((new_trans["date"] - existing.date).days)
                 if date_diff > 1:
                     continue
-
-                # Check amount match (exact)
                 if abs(new_trans["amount"] - existing.amount) > 0.01:
                     continue
+                candidates.append((idx, date_diff))
 
-                # Check text similarity (fuzzy match)
-                text_similarity = SequenceMatcher(
-                    None, new_trans["text"].lower(), (existing.text or "").lower()
-                ).ratio()
-
-                # If text is at least 85% similar, consider it a potential duplicate
-                if text_similarity >= 0.85:
-                    # Calculate overall similarity score
-                    similarity_score = (
-                        (1.0 if date_diff == 0 else 0.8) * 0.3  # Date weight: 30%
-                        + 1.0 * 0.3  # Amount weight: 30% (already matched)
-                        + text_similarity * 0.4  # Text weight: 40%
-                    )
-                    duplicates.append((new_trans, existing, similarity_score))
-                    break  # Only match with first duplicate found
+            if not candidates:
+                continue
+
+            # Text similarity for the surviving candidates in one C-level call
+            candidate_texts = [
+                (existing_transactions[idx].text or "").lower()
+                for idx, _ in candidates
+            ]
+            match = process.extractOne(
+                new_trans["text"].lower(),
+                candidate_texts,
+                scorer=fuzz.ratio,
+                score_cutoff=85.0,
+            )
+            if match is None:
+                continue
+
+            _, score_pct, position = match
+            idx, date_diff = candidates[position]
+            text_similarity = score_pct / 100.0
+
+            # Calculate overall similarity score
+            similarity_score = (
+                (1.0 if date_diff == 0 else 0.8) * 0.3  # Date weight: 30%
+                + 1.0 * 0.3  # Amount weight: 30% (already matched)
+                + text_similarity * 0.4  # Text weight: 40%
+            )
+            duplicates.append(
+                (new_trans, existing_transactions[idx], similarity_score)
+            )
 
         return duplicates
 
@@ -308,6 +436,7 @@ class DatabaseService:
                     vendor.default_product_type = updated_data["default_product_type"]
 
             self.db_session.commit()
+            clear_vendor_lookup_cache()
             return True
         except Exception as e:
             print(f"Error updating vendor: {e}")
@@ -322,6 +451,7 @@ class DatabaseService:
             # Delete all vendors
             self.db_session.query(Vendor).delete()
             self.db_session.commit()
+            clear_vendor_lookup_cache()
             return True, "Database reset successfully"
         except Exception as e:
             self.db_session.rollback()
@@ -357,6 +487,7 @@ class DatabaseService:
             )
 
             self.db_session.commit()
+            clear_vendor_lookup_cache()
             return True, f"Deleted {deleted_count} vendors"
         except Exception as e:
             self.db_session.rollback()
@@ -1,10 +1,22 @@
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from src.models import Vendor
 from difflib import SequenceMatcher
 import re
 
 
+# Process-wide cache of resolved lookups shared by all matcher instances,
+# so repeated vendor names across CSV runs skip the database scan entirely.
+# Stores (vendor_id, score) rather than ORM objects to avoid stale instances.
+_lookup_cache: Dict[str, Optional[Tuple[int, float]]] = {}
+_LOOKUP_CACHE_MAX = 10000
+
+
+def clear_vendor_lookup_cache():
+    """Invalidate cached vendor lookups after vendor create/update/delete."""
+    _lookup_cache.clear()
+
+
 class VendorMatcher:
     def __init__(self, db_session: Session):
         self.db_session = db_session
@@ -14,6 +26,26 @@ class VendorMatcher:
         if not vendor_name:
             return None
 
+        cache_key = vendor_name.casefold()
+        if cache_key in _lookup_cache:
+            hit = _lookup_cache[cache_key]
+            if hit is None:
+                return None
+            vendor = self.db_session.get(Vendor, hit[0])
+            if vendor is not None:
+                return vendor, hit[1]
+            # Cached vendor no longer exists - fall through and re-resolve
+
+        match = self._resolve_vendor(vendor_name)
+
+        if len(_lookup_cache) >= _LOOKUP_CACHE_MAX:
+            _lookup_cache.pop(next(iter(_lookup_cache)))
+        _lookup_cache[cache_key] = (match[0].id, match[1]) if match else None
+
+        return match
+
+    def _resolve_vendor(self, vendor_name: str) -> Optional[Tuple[Vendor, float]]:
+        """Resolve a vendor name against the database (uncached)."""
         normalized_input = self._normalize_name(vendor_name)
         if not normalized_input:
             return None
@@ -124,6 +156,8 @@ class VendorMatcher:
         try:
             self.db_session.add(vendor)
             self.db_session.commit()
+            # New vendor may satisfy lookups that previously cached a miss
+            clear_vendor_lookup_cache()
             return vendor
         except Exception:
             # Handle race condition